@@ -0,0 +1,38 @@
+@echo off
+REM ============================================================================
+REM Calendar App Launcher (PyPy) - Double-click this file to run the app on PyPy
+REM ============================================================================
+REM 
+REM Same as CalendarApp.bat, but runs the app under PyPy instead of CPython.
+REM PyPy's tracing JIT speeds up the pure-Python callback and timeline code
+REM (like compiling with optimizations on instead of running a debug build).
+REM The app has no compiled dependencies, so no other changes are needed.
+
+REM Change to the src directory (parent of calendar_app package)
+REM %~dp0 = directory where this batch file is located
+cd /d "%~dp0\src"
+
+REM Check if PyPy is available on PATH
+pypy3 --version >nul 2>&1
+if errorlevel 1 (
+    echo ERROR: PyPy is not installed or pypy3 is not on PATH
+    echo Please install PyPy 3.x or use CalendarApp.bat instead
+    pause
+    exit /b 1
+)
+
+REM Print startup message
+echo Starting UK ILR Calendar App...
+echo Using PyPy (pypy3.exe)...
+echo.
+
+REM Run the Python application as a module
+pypy3 -m calendar_app.main
+
+REM If we get here, the app has closed
+echo.
+echo Calendar App has closed.
+
+REM Keep window open so user can see any error messages
+echo Press any key to close this window...
+pause >nul
@@ -7,9 +7,47 @@ This module encapsulates all configuration-related functionality.
 
 # Standard library imports
 import json                            # JSON parsing library (like cJSON in C)
-from datetime import datetime, timedelta  # Date/time handling
+from functools import cached_property  # Lazily computed, then stored attribute
+from datetime import date                # Date/time handling
 from pathlib import Path               # Modern path manipulation  
-from typing import Optional           # Type hints (like declaring types in C headers)
+from typing import Dict, Optional, Tuple  # Type hints (like declaring types in C headers)
+
+# Optional fast JSON parser - falls back to the standard library if not installed
+# Both loads() functions accept raw bytes, so the file can be read in binary mode
+try:
+    import orjson                      # C/SIMD accelerated JSON parser
+    _json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+# Module-level cache of parsed configurations (like a static variable in a C file)
+# Maps config_path -> (st_mtime_ns, st_size, attribute values)
+# A changed modification time or size invalidates the entry automatically
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, dict]] = {}
+
+
+def add_years(start: date, years: int) -> date:
+    """
+    Add a whole number of calendar years to a date.
+    
+    Rounding mode: a 29 February start date rounds DOWN to 28 February when the
+    target year is not a leap year (same rule as the ILR requirement calculation).
+    
+    Args:
+        start: Date to add years to
+        years: Number of calendar years to add
+        
+    Returns:
+        Date on the same day/month, `years` years later
+    """
+    try:
+        return start.replace(year=start.year + years)
+    except ValueError:
+        # Feb 29 on non-leap year, use Feb 28
+        return start.replace(year=start.year + years, day=28)
+
 
 class AppConfig:
     """
@@ -19,6 +57,30 @@ class AppConfig:
     Similar to a configuration manager in C applications.
     """
     
+    # Attributes stored in _CONFIG_CACHE (loaded values + derived values)
+    _CACHED_ATTRIBUTES = (
+        "travel_pdf_folder",
+        "objective_years",
+        "processing_buffer_years",
+        "start_year",
+        "end_year",
+        "first_entry_date",
+        "first_entry_date_obj",
+        "target_completion_date",
+        "ilr_target_days",
+        "planning_completion_date",
+        "travel_pdf_path",
+    )
+    
+    # Integer field validation table: (attribute, min, max, error message)
+    # None means the bound is not checked (like a lookup table in C)
+    _INT_FIELDS = (
+        ("objective_years", 5, None, "objective_years must be a positive integer bigger than 5"),
+        ("processing_buffer_years", 0, None, "processing_buffer_years must be a non-negative integer"),
+        ("start_year", 2000, 2100, "start_year must be a valid year between 2000 and 2100"),
+        ("end_year", None, 2100, "end_year must be greater than start_year and no later than 2100"),
+    )
+    
     def __init__(self, project_root: Path):
         """
         Initialize configuration from config.json.
@@ -45,11 +107,61 @@ class AppConfig:
         self.end_year = 2040
         self.first_entry_date = "29-03-2023"
         
-        # Load actual configuration from file
-        self.load_config()                 # Parse and validate JSON
+        # Reuse a previous parse of the same unchanged file if available
+        if not self._load_from_cache():
+            # Load actual configuration from file
+            self.load_config()                 # Parse and validate JSON
+            
+            # Calculate derived values from loaded config
+            self.calculate_derived_values()    # Compute target dates, etc.
+            
+            # Remember the result for subsequent instantiations
+            self._store_in_cache()
         
-        # Calculate derived values from loaded config
-        self.calculate_derived_values()    # Compute target dates, etc.
+    @classmethod
+    def clear_cache(cls):
+        """
+        Clear the module-level configuration cache.
+        
+        Forces the next AppConfig instantiation to re-read config.json
+        (useful for testing).
+        """
+        _CONFIG_CACHE.clear()
+        
+    def _load_from_cache(self) -> bool:
+        """
+        Populate this instance from the configuration cache.
+        
+        The cache entry is only used if config.json has the same modification
+        time and size as when it was parsed.
+        
+        Returns:
+            True if values were loaded from cache, False on cache miss
+        """
+        cached = _CONFIG_CACHE.get(self.config_path)
+        if cached is None:
+            return False
+            
+        try:
+            st = self.config_path.stat()
+        except OSError:
+            # File disappeared - let load_config() report the error
+            return False
+            
+        mtime_ns, size, values = cached
+        if (st.st_mtime_ns, st.st_size) != (mtime_ns, size):
+            return False
+            
+        # Copy cached attribute values onto this instance
+        for name, value in values.items():
+            setattr(self, name, value)
+        return True
+        
+    def _store_in_cache(self):
+        """Store loaded and derived configuration values in the cache."""
+        st = self.config_path.stat()
+        values = {name: getattr(self, name) for name in self._CACHED_ATTRIBUTES}
+        _CONFIG_CACHE[self.config_path] = (st.st_mtime_ns, st.st_size, values)
         
     def load_config(self):
         """
@@ -65,11 +177,9 @@ class AppConfig:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
             
         try:
-            # Open file for reading with UTF-8 encoding
-            # 'with' statement ensures file is closed automatically (like RAII in C++)
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                # Parse JSON content into Python dictionary (like hash map)
-                config_data = json.load(f)
+            # Read the whole file as raw bytes in one call (parser handles UTF-8 decoding)
+            # Parse JSON content into Python dictionary (like hash map)
+            config_data = _json_loads(self.config_path.read_bytes())
                 
             # Update instance variables from JSON data
             # dict.get(key, default) returns value for key, or default if key missing
@@ -84,7 +194,7 @@ class AppConfig:
             # Validate that all values are reasonable
             self.validate_config()
             
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             # Specific exception for JSON parsing errors
             raise ValueError(f"Invalid JSON in config file: {e}")
             
@@ -99,35 +209,34 @@ class AppConfig:
         Checks that all configuration values are reasonable and consistent.
         Raises ValueError if any validation fails.
         """
-        # Validate objective_years is a positive integer
+        # Validate integer fields against their (min, max) bounds in one pass
         # isinstance() is like checking variable type (similar to typeof in C)
-        if not isinstance(self.objective_years, int) or self.objective_years < 5:
-            raise ValueError("objective_years must be a positive integer bigger than 5")
-            
-        # Validate processing_buffer_years is non-negative integer  
-        if not isinstance(self.processing_buffer_years, int) or self.processing_buffer_years < 0:
-            raise ValueError("processing_buffer_years must be a non-negative integer")
-            
-        # Validate start_year is reasonable
-        if not isinstance(self.start_year, int) or self.start_year < 2000 or self.start_year > 2100:
-            raise ValueError("start_year must be a valid year between 2000 and 2100")
-            
-        # Validate end_year is after start_year and within reasonable bounds
-        if not isinstance(self.end_year, int) or self.end_year <= self.start_year or self.end_year > 2100:
+        for name, min_value, max_value, message in self._INT_FIELDS:
+            value = getattr(self, name)
+            if (not isinstance(value, int) or
+                    (min_value is not None and value < min_value) or
+                    (max_value is not None and value > max_value)):
+                raise ValueError(message)
+                
+        # Validate end_year is after start_year (cross-field check)
+        if self.end_year <= self.start_year:
             raise ValueError("end_year must be greater than start_year and no later than 2100")
             
         # Validate and parse first_entry_date format
         try:
-            # strptime parses date string according to format (like strptime in C)
-            # %d = day, %m = month, %Y = 4-digit year (European format DD-MM-YYYY)
-            self.first_entry_date_obj = datetime.strptime(self.first_entry_date, "%d-%m-%Y").date()
+            # Fixed European format DD-MM-YYYY - split on '-' instead of running
+            # the generic strptime format interpreter (like sscanf("%d-%d-%d") in C)
+            # Wrong number of parts, non-numeric parts or an impossible date all raise ValueError
+            day, month, year = self.first_entry_date.split('-')
+            self.first_entry_date_obj = date(int(year), int(month), int(day))
             
-        except ValueError:
+        except (ValueError, AttributeError):
+            # AttributeError: value in JSON was not a string
             raise ValueError("first_entry_date must be in DD-MM-YYYY format")
             
         # Validate date is within the configured year range
-        start_date = datetime(self.start_year, 1, 1).date()  # January 1st of start year
-        end_date = datetime(self.end_year, 12, 31).date()    # December 31st of end year
+        start_date = date(self.start_year, 1, 1)  # January 1st of start year
+        end_date = date(self.end_year, 12, 31)    # December 31st of end year
         
         # Check if first_entry_date is within valid range
         if not (start_date <= self.first_entry_date_obj <= end_date):
@@ -141,20 +250,22 @@ class AppConfig:
         This is like calculating constants from #define values in C.
         """
         # Calculate target completion date
-        # Add exactly objective_years worth of days to first_entry_date
-        # timedelta represents a duration (like adding seconds to time_t in C)
-        # This automatically handles leap years through Python's date arithmetic
-        days_to_add = timedelta(days=self.objective_years * 365)
-        self.target_completion_date = self.first_entry_date_obj + days_to_add
+        # Add whole calendar years to first_entry_date (not a 365-days-per-year approximation)
+        # so leap days inside the period are counted exactly
+        self.target_completion_date = add_years(self.first_entry_date_obj, self.objective_years)
         
         # Calculate exact number of days from start to target
-        # This accounts for leap years automatically
-        date_diff = self.target_completion_date - self.first_entry_date_obj
-        self.ilr_target_days = date_diff.days
+        # Date subtraction accounts for leap years automatically
+        self.ilr_target_days = (self.target_completion_date - self.first_entry_date_obj).days
+        
+        # Drop any previously formatted target date so it is re-formatted on next access
+        self.__dict__.pop('target_completion_str', None)
         
         # Calculate planning horizon (includes processing buffer)
-        buffer_days = timedelta(days=(self.objective_years + self.processing_buffer_years) * 365)
-        self.planning_completion_date = self.first_entry_date_obj + buffer_days
+        self.planning_completion_date = add_years(
+            self.first_entry_date_obj,
+            self.objective_years + self.processing_buffer_years
+        )
         
         # Resolve travel PDF folder path
         # Handle both absolute paths and relative paths
@@ -167,6 +278,16 @@ class AppConfig:
             # Path is relative (like ../travel_pdfs), make it absolute
             self.travel_pdf_path = self.project_root / self.travel_pdf_folder
             
+    @cached_property
+    def target_completion_str(self) -> str:
+        """
+        Target completion date formatted as DD-MM-YYYY.
+        
+        Computed on first access and then stored on the instance
+        (like a lazily initialized static buffer in C).
+        """
+        return self.target_completion_date.strftime('%d-%m-%Y')
+        
     def get_summary(self) -> str:
         """
         Get a human-readable summary of the configuration.
@@ -176,16 +297,17 @@ class AppConfig:
             
         The '-> str' is a return type hint (optional but helpful)
         """
-        # Build string with explicit newlines 
-        summary = "Configuration Summary:"
-        summary += f"\n• Objective: {self.objective_years} years of residence"
-        summary += f"\n• Processing buffer: {self.processing_buffer_years} years"
-        summary += f"\n• Timeline: {self.start_year}-{self.end_year}"
-        summary += f"\n• First entry: {self.first_entry_date}"
-        summary += f"\n• Target completion: {self.target_completion_date.strftime('%d-%m-%Y')}"
-        summary += f"\n• ILR target days: {self.ilr_target_days}"
-        summary += f"\n• Travel PDFs: {self.travel_pdf_path}"
-        return summary
+        # Build all lines first, then join once (avoids repeated string copies)
+        return "\n".join((
+            "Configuration Summary:",
+            f"• Objective: {self.objective_years} years of residence",
+            f"• Processing buffer: {self.processing_buffer_years} years",
+            f"• Timeline: {self.start_year}-{self.end_year}",
+            f"• First entry: {self.first_entry_date}",
+            f"• Target completion: {self.target_completion_str}",
+            f"• ILR target days: {self.ilr_target_days}",
+            f"• Travel PDFs: {self.travel_pdf_path}",
+        ))
 
     def __repr__(self) -> str:
         """
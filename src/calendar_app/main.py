@@ -10,19 +10,20 @@ Python uses modules/packages instead of header files.
 """
 
 # Standard library imports (like #include in C, but more flexible)
-import tkinter as tk                    # GUI toolkit - like Windows API but cross-platform
-from tkinter import messagebox         # Dialog boxes for errors/warnings
-import os                              # Operating system interface
-import sys                             # Python interpreter interface  
+# tkinter and the application modules are imported lazily inside the methods
+# that use them, so importing this module does not load the whole GUI stack
+import logging                         # Diagnostics (like a debug log instead of printf)
 from pathlib import Path               # Modern path handling (better than os.path)
 
-# Local module imports - our own code files
-from calendar_app.config import AppConfig           # Configuration management class
-from calendar_app.storage.json_loader import DataLoader  # JSON data loading utilities
-from calendar_app.ui.grid_layout_manager import GridLayoutManager  # Main 2x2 grid layout coordinator
-from calendar_app.model.timeline import DateTimeline          # Date timeline with ILR logic
-from calendar_app.model.trips import TripClassifier        # Trip classification system
-from calendar_app.model.visaPeriods import VisaClassifier  # Visa period classification system
+# Module logger - diagnostics are silent unless the user enables INFO logging,
+# e.g. logging.basicConfig(level=logging.INFO), so normal runs skip console I/O
+log = logging.getLogger(__name__)
+
+# Project root directory, computed once at import time (like a static const in C)
+# __file__ is current Python file path, like __FILE__ macro in C
+# parents[2] goes up 3 levels: main.py -> calendar_app -> src -> project_root
+# resolve() normalizes symlinks once so AppConfig gets a stable config path
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 class CalendarApp:
     """
@@ -42,6 +43,9 @@ class CalendarApp:
         Python doesn't have explicit memory management like C - 
         garbage collector handles allocation/deallocation automatically.
         """
+        # GUI toolkit - like Windows API but cross-platform
+        import tkinter as tk
+        
         # Create the main tkinter window - like CreateWindow() in Win32 API
         self.root = tk.Tk()                # 'self.' stores instance variables (like struct members)
         
@@ -50,6 +54,8 @@ class CalendarApp:
         self.data_loader = None            # Will hold data loading object
         self.trips = []                    # Initialize as empty list (prevent AttributeError)
         self.visaPeriods = []             # Initialize as empty list (prevent AttributeError)
+        self.main_frame = None             # Container for the grid layout
+        self.grid_layout = None            # Built after the window first becomes idle
         
         # Call initialization methods in sequence
         # (Python allows calling methods from constructor, unlike some C conventions)
@@ -66,26 +72,23 @@ class CalendarApp:
         # Set window title (shown in title bar)
         self.root.title("UK ILR Calendar App")
         
-        # Set initial window size - increased for year view
-        self.root.geometry("1200x700")
-        
         # Allow window resizing (True = resizable, False = fixed size)
         self.root.resizable(True, True)
         
-        # Center the window on screen (like calculating screen coordinates in C)
-        self.root.update_idletasks()       # Force tkinter to calculate sizes first
+        # Initial window size - increased for year view
+        window_width = 1200
+        window_height = 700
         
-        # Get screen dimensions and calculate center position
+        # Center the window on screen (like calculating screen coordinates in C)
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
-        window_width = 1200  # Use actual geometry values instead of winfo_reqwidth()
-        window_height = 700  # Use actual geometry values instead of winfo_reqheight()
         
         # Calculate center coordinates (integer division with //)
         x = (screen_width - window_width) // 2
         y = (screen_height - window_height) // 2
         
-        # Set window position and size together: widthxheight+x+y
+        # Set window size and position in a single geometry call: widthxheight+x+y
+        # (no need to size first and force a layout pass with update_idletasks())
         self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
         
         # Set minimum window size for year view - increased width for 3x4 month grid
@@ -101,19 +104,24 @@ class CalendarApp:
         Python exception handling with try/except is like try/catch in C++
         Unlike C error codes, Python uses exceptions for error handling
         """
+        # Local module imports - our own code files (deferred until data is needed)
+        from calendar_app.config import AppConfig           # Configuration management class
+        from calendar_app.storage.json_loader import DataLoader  # JSON data loading utilities
+        from calendar_app.model.timeline import DateTimeline          # Date timeline with ILR logic
+        from calendar_app.model.trips import TripClassifier        # Trip classification system
+        from calendar_app.model.visaPeriods import VisaClassifier  # Visa period classification system
+        
         try:
-            # Get project root directory using pathlib (modern Python path handling)
-            # __file__ is current Python file path, like __FILE__ macro in C
-            # parent.parent.parent goes up 3 directories: main.py -> calendar_app -> src -> project_root
-            project_root = Path(__file__).parent.parent.parent
+            # Get project root directory (computed once at module import)
+            project_root = _PROJECT_ROOT
             
             # Create configuration object (calls AppConfig.__init__)
             self.config = AppConfig(project_root)
             
-            # Print statements go to console (like printf in C)
-            print(f"✓ Configuration loaded successfully")
-            print(f"  - Objective years: {self.config.objective_years}")
-            print(f"  - First entry date: {self.config.first_entry_date}")
+            # Log arguments are only formatted if INFO logging is enabled
+            log.info("✓ Configuration loaded successfully")
+            log.info("  - Objective years: %s", self.config.objective_years)
+            log.info("  - First entry date: %s", self.config.first_entry_date)
             
             # Create data loader object with config for validation
             self.data_loader = DataLoader(project_root, self.config)
@@ -122,9 +130,9 @@ class CalendarApp:
             # Python functions can return multiple values (unlike C)
             trips, visaPeriods = self.data_loader.load_all_data()
             
-            print(f"✓ Data loaded successfully")
-            print(f"  - {len(trips)} trips loaded")        # len() gets array/list size
-            print(f"  - {len(visaPeriods)} visa periods loaded")
+            log.info("✓ Data loaded successfully")
+            log.info("  - %d trips loaded", len(trips))        # len() gets array/list size
+            log.info("  - %d visa periods loaded", len(visaPeriods))
             
             # Store data as instance variables for later use
             self.trips = trips
@@ -139,21 +147,22 @@ class CalendarApp:
             # Create date timeline with trip and visa integration
             self.timeline = DateTimeline.from_config(self.config, self.trip_classifier, self.visaPeriod_classifier)
             
-            print(f"✓ Timeline initialized with {self.timeline.get_total_days()} days")
-            print(f"  - Date range: {self.config.start_year}-{self.config.end_year}")
+            log.info("✓ Timeline initialized with %d days", self.timeline.get_total_days())
+            log.info("  - Date range: %s-%s", self.config.start_year, self.config.end_year)
             
         except Exception as e:
             # Exception handling - 'e' contains the error object
             # str() converts any object to string (like toString())
             error_msg = f"Failed to load data: {str(e)}"
             
-            print(f"✗ {error_msg}")
+            log.error("✗ %s", error_msg)
             
             # Ensure root window is ready before showing popup
             self.root.update_idletasks()
             
             # Show error dialog to user (like MessageBox in Win32)
             # Make sure the dialog appears on top and gets focus
+            from tkinter import messagebox     # Dialog boxes, only needed on failure
             messagebox.showerror("Data Loading Error", error_msg, parent=self.root)
             
             # Re-raise the exception to propagate it up to main() for centralized handling
@@ -166,24 +175,56 @@ class CalendarApp:
         In tkinter, widgets are GUI elements (buttons, labels, etc.)
         Similar to creating controls in Win32 API or MFC
         """
+        import tkinter as tk
+        
         # Create main container frame with padding
         # Frame is like a panel or container - groups other widgets
-        main_frame = tk.Frame(self.root, padx=10, pady=10)  # padx/pady = internal padding
+        self.main_frame = tk.Frame(self.root, padx=10, pady=10)  # padx/pady = internal padding
         
         # Pack geometry manager arranges widgets in container
         # pack() is like adding to a vertical or horizontal layout
-        main_frame.pack(fill=tk.BOTH, expand=True)  # fill entire window, expand when resized
+        self.main_frame.pack(fill=tk.BOTH, expand=True)  # fill entire window, expand when resized
+        
+        # Build the (heavy) grid layout once the event loop is idle,
+        # so the window is shown first and the calendar fills in afterwards
+        self.root.after_idle(self._build_grid_layout)
+        
+    def _build_grid_layout(self):
+        """
+        Build the 2x2 grid layout inside the main frame.
         
-        # Grid layout manager - handles the 2x2 layout with ILR statistics and calendar
-        # Now uses the new modular architecture with self-contained modules
-        self.grid_layout = GridLayoutManager(
-            main_frame, 
-            config=self.config, 
-            timeline=self.timeline
-        )
+        Scheduled with after_idle() from create_widgets() (like posting a
+        message to the Win32 message queue instead of handling it inline).
         
-        # Pack the grid layout to fill the entire main frame
-        self.grid_layout.pack(fill=tk.BOTH, expand=True)
+        Runs inside the event loop, so exceptions would not reach main();
+        failures are reported here and the window is closed instead.
+        """
+        import tkinter as tk
+        from calendar_app.ui.grid_layout_manager import GridLayoutManager  # Main 2x2 grid layout coordinator
+        
+        try:
+            # Grid layout manager - handles the 2x2 layout with ILR statistics and calendar
+            # Now uses the new modular architecture with self-contained modules
+            self.grid_layout = GridLayoutManager(
+                self.main_frame, 
+                config=self.config, 
+                timeline=self.timeline
+            )
+            
+            # Pack the grid layout to fill the entire main frame
+            self.grid_layout.pack(fill=tk.BOTH, expand=True)
+            
+        except Exception as e:
+            # Same failure path as load_data(): log, show a dialog, then close
+            # the window (mainloop returns and main() runs its cleanup)
+            error_msg = f"Failed to build calendar layout: {str(e)}"
+            
+            log.exception("✗ %s", error_msg)
+            
+            from tkinter import messagebox     # Dialog boxes, only needed on failure
+            messagebox.showerror("Application Error", error_msg, parent=self.root)
+            
+            self.root.destroy()
         
     def day_clicked(self, clicked_date):
         """
@@ -194,8 +235,7 @@ class CalendarApp:
         """
         # For now, just show basic information
         # Later this will show trip details, visa periods, etc.
-        date_str = clicked_date.strftime('%A, %d %B %Y')
-        print(f"Calendar day clicked: {date_str}")
+        log.info("Calendar day clicked: %s", clicked_date.strftime('%A, %d %B %Y'))
         
         # TODO: In next phase, show day details popup with trip information
         
@@ -206,7 +246,7 @@ class CalendarApp:
         This is like the message loop in Win32 programs - processes GUI events
         The method blocks (doesn't return) until user closes the window
         """
-        print("Starting Calendar App...")
+        log.info("Starting Calendar App...")
         
         # Enter tkinter event loop - similar to GetMessage()/DispatchMessage() in Win32
         # This handles button clicks, window resize, etc.
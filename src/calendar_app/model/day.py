@@ -5,7 +5,7 @@ Contains Day class and DayClassification enum for individual day management.
 
 from datetime import date
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 class DayClassification(Enum):
@@ -18,14 +18,105 @@ class DayClassification(Enum):
     UNKNOWN = "unknown"                # Classification not yet determined
 
 
+# Small integer id for each classification (enum definition order), so a run of
+# days can store classifications as one byte each instead of one object per day
+CLASSIFICATIONS = tuple(DayClassification)  # id -> DayClassification
+CLASSIFICATION_IDS = {classification: i for i, classification in enumerate(CLASSIFICATIONS)}  # DayClassification -> id
+UNKNOWN_ID = CLASSIFICATION_IDS[DayClassification.UNKNOWN]
+
+def format_date(date_obj: date) -> str:
+    """Format a date as DD-MM-YYYY (the app's display format) without going through strftime."""
+    return f"{date_obj.day:02d}-{date_obj.month:02d}-{date_obj.year:04d}"
+
+
+# Classification ids tested by the Day.counts_as_* predicates, which compare the raw
+# id byte directly instead of going through the classification property
+_UK_RESIDENCE_ID = CLASSIFICATION_IDS[DayClassification.UK_RESIDENCE]
+_SHORT_TRIP_ID = CLASSIFICATION_IDS[DayClassification.SHORT_TRIP]
+_LONG_TRIP_ID = CLASSIFICATION_IDS[DayClassification.LONG_TRIP]
+_NO_VISA_COVERAGE_ID = CLASSIFICATION_IDS[DayClassification.NO_VISA_COVERAGE]
+
+# Classifications that count toward the ILR total (in-UK + short trip + no visa coverage)
+ILR_TOTAL_CLASSIFICATIONS = frozenset((
+    DayClassification.UK_RESIDENCE,
+    DayClassification.SHORT_TRIP,
+    DayClassification.NO_VISA_COVERAGE,
+))
+_ILR_TOTAL_IDS = frozenset(CLASSIFICATION_IDS[classification] for classification in ILR_TOTAL_CLASSIFICATIONS)
+
+
+class DayStore:
+    """
+    Struct-of-arrays storage for a run of consecutive days.
+    
+    Index i holds the data for the i-th day of the run. Classifications are a
+    bytearray of classification ids (one byte per day, like a uint8_t array in C),
+    so counts and bulk updates run over contiguous memory; per-day metadata is
+    kept in parallel lists.
+    """
+    
+    def __init__(self, size: int):
+        self.classes = bytearray([UNKNOWN_ID]) * size         # Classification id per day
+        self.trip_info: List[Optional[Dict]] = [None] * size  # Trip details for trip days
+        self.visaPeriod_info: List[Optional[Dict]] = [None] * size  # Visa period details for covered days
+        self.visaPeriod: List[Optional[str]] = [None] * size  # Visa period label set by timeline updates
+        self.version = 0  # Bumped on every classification change; keys memoized counts
+
+
 class Day:
-    """Represents a single day in the timeline with its classification."""
+    """
+    Represents a single day in the timeline with its classification.
     
-    def __init__(self, date_obj: date):
+    A Day is a view onto one index of a DayStore: reading or assigning its
+    attributes reads or writes the store. A standalone Day gets its own
+    one-day store; DateTimeline hands out views onto its shared store.
+    """
+    
+    # Fixed attribute layout (like a C struct): no per-instance __dict__, and
+    # attribute reads are slot fetches rather than dict lookups
+    __slots__ = ('date', '_store', '_index')
+    
+    def __init__(self, date_obj: date, store: Optional[DayStore] = None, index: int = 0):
         self.date = date_obj
-        self.classification = DayClassification.UNKNOWN
-        self.trip_info: Optional[Dict] = None  # Will store trip details if it's a trip day
-        self.visaPeriod_info: Optional[Dict] = None  # Will store visa period details if day has visa coverage
+        self._store = store if store is not None else DayStore(1)
+        self._index = index
+    
+    @property
+    def classification(self) -> DayClassification:
+        return CLASSIFICATIONS[self._store.classes[self._index]]
+    
+    @classification.setter
+    def classification(self, classification: DayClassification) -> None:
+        store = self._store
+        store.classes[self._index] = CLASSIFICATION_IDS[classification]
+        store.version += 1
+    
+    @property
+    def trip_info(self) -> Optional[Dict]:
+        """Trip details if it's a trip day."""
+        return self._store.trip_info[self._index]
+    
+    @trip_info.setter
+    def trip_info(self, trip_info: Optional[Dict]) -> None:
+        self._store.trip_info[self._index] = trip_info
+    
+    @property
+    def visaPeriod_info(self) -> Optional[Dict]:
+        """Visa period details if day has visa coverage."""
+        return self._store.visaPeriod_info[self._index]
+    
+    @visaPeriod_info.setter
+    def visaPeriod_info(self, visaPeriod_info: Optional[Dict]) -> None:
+        self._store.visaPeriod_info[self._index] = visaPeriod_info
+    
+    @property
+    def visaPeriod(self) -> Optional[str]:
+        """Visa period label assigned through DateTimeline.update_day_classification()."""
+        return self._store.visaPeriod[self._index]
+    
+    @visaPeriod.setter
+    def visaPeriod(self, visaPeriod: Optional[str]) -> None:
+        self._store.visaPeriod[self._index] = visaPeriod
     
     @property
     def year(self) -> int:
@@ -47,7 +138,7 @@ class Day:
     @property
     def is_weekend(self) -> bool:
         """Returns True if day is Saturday or Sunday"""
-        return self.weekday >= 5
+        return self.date.weekday() >= 5  # Direct C call; skips the weekday property dispatch
     
     def counts_as_ilr_in_uk_day(self, first_entry_date: date) -> bool:
         """
@@ -60,7 +151,7 @@ class Day:
             True if day counts as ILR in-UK day (pure UK residence, no trips)
         """
         return (self.date >= first_entry_date and 
-                self.classification == DayClassification.UK_RESIDENCE)
+                self._store.classes[self._index] == _UK_RESIDENCE_ID)
     
     def counts_as_short_trip_day(self, first_entry_date: date) -> bool:
         """
@@ -73,7 +164,7 @@ class Day:
             True if day is part of short trip (<14 days) and counts toward ILR total
         """
         return (self.date >= first_entry_date and 
-                self.classification == DayClassification.SHORT_TRIP)
+                self._store.classes[self._index] == _SHORT_TRIP_ID)
     
     def counts_as_no_visa_coverage_day(self, first_entry_date: date) -> bool:
         """
@@ -86,7 +177,7 @@ class Day:
             True if day is UK residence without visa coverage (counts toward ILR but tracked separately)
         """
         return (self.date >= first_entry_date and 
-                self.classification == DayClassification.NO_VISA_COVERAGE)
+                self._store.classes[self._index] == _NO_VISA_COVERAGE_ID)
     
     def counts_as_ilr_total_day(self, first_entry_date: date) -> bool:
         """
@@ -100,9 +191,9 @@ class Day:
         Returns:
             True if day counts toward ILR total
         """
-        return (self.counts_as_ilr_in_uk_day(first_entry_date) or 
-                self.counts_as_short_trip_day(first_entry_date) or
-                self.counts_as_no_visa_coverage_day(first_entry_date))
+        # One date comparison and one set lookup instead of three predicate calls
+        return (self.date >= first_entry_date and 
+                self._store.classes[self._index] in _ILR_TOTAL_IDS)
     
     def counts_as_long_trip_day(self, first_entry_date: date) -> bool:
         """
@@ -115,10 +206,10 @@ class Day:
             True if day is part of long trip (tracked but not counted toward ILR)
         """
         return (self.date >= first_entry_date and 
-                self.classification == DayClassification.LONG_TRIP)
+                self._store.classes[self._index] == _LONG_TRIP_ID)
     
     def __str__(self) -> str:
-        return f"Day({self.date.strftime('%d-%m-%Y')}, {self.classification.value})"
+        return f"Day({format_date(self.date)}, {self.classification.value})"
     
     def __repr__(self) -> str:
         return self.__str__()
\ No newline at end of file
@@ -5,17 +5,54 @@ High-level business logic for ILR (Indefinite Leave to Remain) statistics.
 Builds upon DateTimeline to provide ILR-specific calculations, projections, and target completion dates.
 """
 
+from calendar import monthrange
 from datetime import date, timedelta
-from typing import Dict, Optional, Tuple, NamedTuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, NamedTuple
 from dataclasses import dataclass
+from functools import lru_cache
 
+from calendar_app.model.day import DayClassification, format_date
 from calendar_app.model.timeline import DateTimeline
-from calendar_app.config import AppConfig
+from calendar_app.config import AppConfig, add_years
+
+
+@lru_cache(maxsize=None)
+def _ilr_days_required(first_entry: date, objective_years: int) -> int:
+    """
+    Days from first_entry to the same calendar date objective_years later.
+    
+    The year-by-year lengths telescope, so only the final anniversary is needed
+    (add_years applies the Feb 29 -> Feb 28 rounding rule).
+    """
+    return (add_years(first_entry, objective_years) - first_entry).days
+
+
+@lru_cache(maxsize=None)
+def _last_day_of_month(year: int, month: int) -> date:
+    """Last date of a month (a timeline spans at most a few hundred distinct months)."""
+    return date(year, month, monthrange(year, month)[1])
+
+
+class ILRCounts(NamedTuple):
+    """ILR day counts for a date range (fields named as the public count-dict keys)."""
+    ilr_in_uk_days: int
+    short_trip_days: int
+    no_visa_coverage_days: int
+    ilr_total_days: int
+    long_trip_days: int
+    pre_entry_days: int
 
 
 @dataclass
 class ILRProgress:
     """Data class representing ILR progress for a specific scenario."""
+    # Fixed attribute layout (like a C struct), declared by hand because
+    # dataclass(slots=True) needs Python 3.10; fields have no defaults, so
+    # the slot descriptors do not clash with class-level default values
+    __slots__ = ('days_completed', 'days_required', 'days_remaining',
+                 'percentage_complete', 'target_completion_date', 'is_complete')
+    
     days_completed: int
     days_required: int
     days_remaining: int
@@ -32,6 +69,11 @@ class ILRProgress:
 @dataclass
 class ILRStatistics:
     """Complete ILR statistics for both scenarios."""
+    __slots__ = ('ilr_in_uk_days', 'short_trip_days', 'no_visa_coverage_days',
+                 'ilr_total_days', 'long_trip_days', 'pre_entry_days',
+                 'in_uk_scenario', 'total_scenario',
+                 'calculation_date', 'first_entry_date', 'days_since_entry')
+    
     # Raw counts
     ilr_in_uk_days: int
     short_trip_days: int
@@ -81,6 +123,23 @@ class ILRStatisticsEngine:
         
         # Calculate exact ILR requirement based on objective_years and leap years
         self.ilr_days_required = self._calculate_ilr_days_requirement()
+        
+        # Memoized get_ilr_requirement_info() result, keyed on the values it reports
+        self._requirement_info: Optional[Mapping[str, any]] = None
+        self._requirement_info_key: Optional[Tuple[int, str, int]] = None
+        
+        # Memoized get_ilr_counts_total() result, keyed on (timeline version, first entry date)
+        self._ilr_counts_total: Optional[ILRCounts] = None
+        self._ilr_counts_total_key: Optional[Tuple[int, date]] = None
+        
+        # Memoized get_global_statistics() results by calculation date; dropped
+        # whenever the timeline, first entry date, requirement or today changes
+        self._global_stats_cache: Dict[date, ILRStatistics] = {}
+        self._global_stats_key: Optional[Tuple[int, date, int, date]] = None
+        
+        # Formatted get_progress_summary() strings for those memoized statistics,
+        # by calculation date; shares (and is cleared with) the same state key
+        self._summary_cache: Dict[date, Dict[str, str]] = {}
     
     def _calculate_ilr_days_requirement(self) -> int:
         """
@@ -90,52 +149,27 @@ class ILRStatisticsEngine:
         Returns:
             Exact number of days required for ILR
         """
-        first_entry = self.config.first_entry_date_obj
-        objective_years = self.config.objective_years
-        
-        # Calculate end date: first_entry + objective_years
-        # We need to go year by year to account for leap years
-        current_date = first_entry
-        total_days = 0
-        
-        for year_offset in range(objective_years):
-            # Handle the case where first entry date doesn't exist in target year (Feb 29 on non-leap year)
-            try:
-                year_start = date(first_entry.year + year_offset, first_entry.month, first_entry.day)
-            except ValueError:
-                # Feb 29 on non-leap year, use Feb 28
-                year_start = date(first_entry.year + year_offset, first_entry.month, 28)
-            
-            try:
-                year_end = date(first_entry.year + year_offset + 1, first_entry.month, first_entry.day)
-            except ValueError:
-                # Feb 29 on non-leap year, use Feb 28
-                year_end = date(first_entry.year + year_offset + 1, first_entry.month, 28)
-            
-            # For the first year, start from actual first entry date
-            if year_offset == 0:
-                year_start = first_entry
-            
-            # Calculate days in this year of the objective period
-            days_in_year = (year_end - year_start).days
-            total_days += days_in_year
-        
-        return total_days
+        return _ilr_days_required(self.config.first_entry_date_obj, self.config.objective_years)
     
-    def get_ilr_requirement_info(self) -> Dict[str, any]:
+    def get_ilr_requirement_info(self) -> Mapping[str, any]:
         """
         Get information about the ILR requirement calculation.
         
         Returns:
-            Dict with requirement details
+            Read-only mapping with requirement details (shared between calls)
         """
-        return {
-            'objective_years': self.config.objective_years,
-            'first_entry_date': self.config.first_entry_date,
-            'days_required': self.ilr_days_required,
-            'average_days_per_year': self.ilr_days_required / self.config.objective_years,
-            'calculation_method': 'Exact calculation accounting for leap years'
-        }
+        config = self.config
+        cache_key = (config.objective_years, config.first_entry_date, self.ilr_days_required)
+        if self._requirement_info_key != cache_key:
+            self._requirement_info = MappingProxyType({
+                'objective_years': config.objective_years,
+                'first_entry_date': config.first_entry_date,
+                'days_required': self.ilr_days_required,
+                'average_days_per_year': self.ilr_days_required / config.objective_years,
+                'calculation_method': 'Exact calculation accounting for leap years'
+            })
+            self._requirement_info_key = cache_key
+        return self._requirement_info
     
     def get_global_statistics(self, calculation_date: Optional[date] = None) -> ILRStatistics:
         """
@@ -145,48 +179,65 @@ class ILRStatisticsEngine:
             calculation_date: Date to calculate statistics up to (default: today)
             
         Returns:
-            ILRStatistics with complete progress information
+            ILRStatistics with complete progress information (shared between calls
+            with the same calculation date; treat as read-only)
         """
-        calc_date = calculation_date or date.today()
+        today = date.today()
+        calc_date = calculation_date or today
+        
+        # Read once per query; the config is live, so it is not bound at construction
+        first_entry = self.config.first_entry_date_obj
+        
+        # Progress depends on the day data, first entry, requirement and today's date
+        state_key = (self.timeline.version, first_entry, self.ilr_days_required, today)
+        if self._global_stats_key != state_key:
+            self._global_stats_cache.clear()
+            self._summary_cache.clear()
+            self._global_stats_key = state_key
+        cached = self._global_stats_cache.get(calc_date)
+        if cached is not None:
+            return cached
         
         # Get raw counts from timeline up to calculation date
         if calc_date >= date(self.timeline.end_year, 12, 31):
             # Use total timeline counts
-            raw_counts = self.get_ilr_counts_total()
+            raw_counts = self._ilr_counts_total_tuple()
         else:
             # Use date range from first entry to calculation date
-            raw_counts = self.get_ilr_counts_for_date_range(
-                self.config.first_entry_date_obj, 
+            raw_counts = self._ilr_counts_for_range(
+                first_entry, 
                 calc_date
             )
         
         # Calculate days since entry (inclusive of both start and end dates)
         # Formula: (end_date - start_date).days + 1 to include both endpoints
-        days_since_entry = max(0, (calc_date - self.config.first_entry_date_obj).days + 1)
+        days_since_entry = max(0, (calc_date - first_entry).days + 1)
         
         # Create progress objects for both scenarios (same requirement, different counting)
         in_uk_progress = self._calculate_progress(
-            days_completed=raw_counts['ilr_in_uk_days'],
+            days_completed=raw_counts.ilr_in_uk_days,
             days_required=self.ilr_days_required,
             calculation_date=calc_date,
-            scenario_type='in_uk'
+            scenario_type='in_uk',
+            today=today
         )
         
         total_progress = self._calculate_progress(
-            days_completed=raw_counts['ilr_total_days'],
+            days_completed=raw_counts.ilr_total_days,
             days_required=self.ilr_days_required,
             calculation_date=calc_date,
-            scenario_type='total'
+            scenario_type='total',
+            today=today
         )
         
-        return ILRStatistics(
+        statistics = ILRStatistics(
             # Raw counts
-            ilr_in_uk_days=raw_counts['ilr_in_uk_days'],
-            short_trip_days=raw_counts['short_trip_days'],
-            no_visa_coverage_days=raw_counts['no_visa_coverage_days'],
-            ilr_total_days=raw_counts['ilr_total_days'],
-            long_trip_days=raw_counts['long_trip_days'],
-            pre_entry_days=raw_counts['pre_entry_days'],
+            ilr_in_uk_days=raw_counts.ilr_in_uk_days,
+            short_trip_days=raw_counts.short_trip_days,
+            no_visa_coverage_days=raw_counts.no_visa_coverage_days,
+            ilr_total_days=raw_counts.ilr_total_days,
+            long_trip_days=raw_counts.long_trip_days,
+            pre_entry_days=raw_counts.pre_entry_days,
             
             # Progress tracking
             in_uk_scenario=in_uk_progress,
@@ -194,9 +245,21 @@ class ILRStatisticsEngine:
             
             # Date information
             calculation_date=calc_date,
-            first_entry_date=self.config.first_entry_date_obj,
+            first_entry_date=first_entry,
             days_since_entry=days_since_entry
         )
+        self._global_stats_cache[calc_date] = statistics
+        return statistics
+    
+    def invalidate_cache(self) -> None:
+        """Drop memoized statistics and counts (e.g. after replacing timeline or config data)."""
+        self._global_stats_cache.clear()
+        self._summary_cache.clear()
+        self._global_stats_key = None
+        self._ilr_counts_total = None
+        self._ilr_counts_total_key = None
+        self._requirement_info = None
+        self._requirement_info_key = None
     
     def get_remaining_days_breakdown(self, scenario: str = "total", calculation_date: Optional[date] = None) -> Dict[str, int]:
         """
@@ -264,34 +327,19 @@ class ILRStatisticsEngine:
         Returns:
             Tuple of (covered_days, uncovered_days)
         """
-        from calendar_app.model.day import DayClassification
-        
-        covered_count = 0
-        uncovered_count = 0
-        end_date = date(self.timeline.end_year, 12, 31)
-        current_date = from_date
-        
-        while current_date <= end_date:
-            if self.timeline.is_date_in_range(current_date):
-                day_obj = self.timeline.get_day(current_date)
-                if day_obj:
-                    classification = day_obj.classification
-                    
-                    # Count days that would contribute to the specific scenario
-                    if scenario == "in_uk":
-                        # In-UK scenario: only UK_RESIDENCE and NO_VISA_COVERAGE count
-                        if classification == DayClassification.UK_RESIDENCE:
-                            covered_count += 1
-                        elif classification == DayClassification.NO_VISA_COVERAGE:
-                            uncovered_count += 1
-                    else:
-                        # Total scenario: UK_RESIDENCE, SHORT_TRIP, and NO_VISA_COVERAGE count
-                        if classification in [DayClassification.UK_RESIDENCE, DayClassification.SHORT_TRIP]:
-                            covered_count += 1
-                        elif classification == DayClassification.NO_VISA_COVERAGE:
-                            uncovered_count += 1
-                            
-            current_date += timedelta(days=1)
+        # One classification count over the remaining timeline instead of a per-day walk
+        class_counts = self.timeline.get_classification_counts_for_date_range(
+            from_date, date(self.timeline.end_year, 12, 31)
+        )
+        
+        # Count days that would contribute to the specific scenario
+        if scenario == "in_uk":
+            # In-UK scenario: only UK_RESIDENCE and NO_VISA_COVERAGE count
+            covered_count = class_counts[DayClassification.UK_RESIDENCE]
+        else:
+            # Total scenario: UK_RESIDENCE, SHORT_TRIP, and NO_VISA_COVERAGE count
+            covered_count = class_counts[DayClassification.UK_RESIDENCE] + class_counts[DayClassification.SHORT_TRIP]
+        uncovered_count = class_counts[DayClassification.NO_VISA_COVERAGE]
                     
         return covered_count, uncovered_count
     
@@ -306,12 +354,8 @@ class ILRStatisticsEngine:
         Returns:
             ILRStatistics for the specified month
         """
-        # Get month counts
-        raw_counts = self.get_ilr_counts_for_month(year, month)
-        
         # For monthly stats, we calculate cumulative progress up to end of month
-        from calendar import monthrange
-        last_day_of_month = date(year, month, monthrange(year, month)[1])
+        last_day_of_month = _last_day_of_month(year, month)
         
         return self.get_global_statistics(calculation_date=last_day_of_month)
     
@@ -325,16 +369,14 @@ class ILRStatisticsEngine:
         Returns:
             ILRStatistics for the specified year
         """
-        # Get year counts
-        raw_counts = self.get_ilr_counts_for_year(year)
-        
         # For yearly stats, we calculate cumulative progress up to end of year
         last_day_of_year = date(year, 12, 31)
         
         return self.get_global_statistics(calculation_date=last_day_of_year)
     
     def _calculate_progress(self, days_completed: int, days_required: int, 
-                          calculation_date: date, scenario_type: str) -> ILRProgress:
+                          calculation_date: date, scenario_type: str,
+                          today: Optional[date] = None) -> ILRProgress:
         """
         Calculate progress metrics for a specific scenario.
         
@@ -343,17 +385,24 @@ class ILRStatisticsEngine:
             days_required: Number of days required
             calculation_date: Date of calculation
             scenario_type: 'in_uk' or 'total' for projection logic
+            today: Today's date if the caller already has it (default: date.today())
             
         Returns:
             ILRProgress with calculated metrics
         """
-        days_remaining = max(0, days_required - days_completed)
-        percentage_complete = min(100.0, (days_completed / days_required) * 100)
-        is_complete = days_completed >= days_required
+        # One comparison decides completion, remaining days and the percentage cap
+        days_short = days_required - days_completed
+        is_complete = days_short <= 0
+        if is_complete:
+            days_remaining = 0
+            percentage_complete = 100.0
+        else:
+            days_remaining = days_short
+            percentage_complete = (days_completed / days_required) * 100
         
         # Calculate target completion date
         target_completion_date = None
-        if not is_complete and calculation_date <= date.today():
+        if not is_complete and calculation_date <= (today or date.today()):
             # Simple projection: assume continuous UK residence from calculation_date
             target_completion_date = calculation_date + timedelta(days=days_remaining)
         
@@ -376,14 +425,28 @@ class ILRStatisticsEngine:
         Returns:
             Dict with formatted progress strings
         """
+        # Statistics are memoized per calculation date, so the same object is
+        # often summarized repeatedly; format its strings only once. Only the
+        # currently memoized object for its date is cached - any other
+        # ILRStatistics passed in is formatted afresh.
+        calc_date = statistics.calculation_date
+        if self._global_stats_cache.get(calc_date) is not statistics:
+            return self._format_progress_summary(statistics)
+        summary = self._summary_cache.get(calc_date)
+        if summary is None:
+            summary = self._summary_cache[calc_date] = self._format_progress_summary(statistics)
+        return dict(summary)
+    
+    def _format_progress_summary(self, statistics: ILRStatistics) -> Dict[str, str]:
+        """Build the formatted strings for get_progress_summary()."""
         return {
             'in_uk_progress': f"{statistics.in_uk_scenario.days_completed:,} / {statistics.in_uk_scenario.days_required:,} days ({statistics.in_uk_scenario.percentage_complete:.1f}%)",
             'total_progress': f"{statistics.total_scenario.days_completed:,} / {statistics.total_scenario.days_required:,} days ({statistics.total_scenario.percentage_complete:.1f}%)",
             'days_since_entry': f"{statistics.days_since_entry:,} days since first entry",
             'in_uk_remaining': f"{statistics.in_uk_scenario.days_remaining:,} days remaining" if not statistics.in_uk_scenario.is_complete else "✅ In-UK requirement complete!",
             'total_remaining': f"{statistics.total_scenario.days_remaining:,} days remaining" if not statistics.total_scenario.is_complete else "✅ Total requirement complete!",
-            'in_uk_target': statistics.in_uk_scenario.target_completion_date.strftime('%d-%m-%Y') if statistics.in_uk_scenario.target_completion_date else "N/A",
-            'total_target': statistics.total_scenario.target_completion_date.strftime('%d-%m-%Y') if statistics.total_scenario.target_completion_date else "N/A"
+            'in_uk_target': format_date(statistics.in_uk_scenario.target_completion_date) if statistics.in_uk_scenario.target_completion_date else "N/A",
+            'total_target': format_date(statistics.total_scenario.target_completion_date) if statistics.total_scenario.target_completion_date else "N/A"
         }
     
     def get_ilr_counts_total(self) -> Dict[str, int]:
@@ -394,123 +457,78 @@ class ILRStatisticsEngine:
         Returns:
             Dict with keys: 'ilr_in_uk_days', 'short_trip_days', 'no_visa_coverage_days', 'ilr_total_days', 'long_trip_days', 'pre_entry_days'
         """
+        return self._ilr_counts_total_tuple()._asdict()
+    
+    def _ilr_counts_total_tuple(self) -> ILRCounts:
+        """Whole-timeline ILR counts, memoized while no day or the first entry date changes."""
         first_entry = self.config.first_entry_date_obj
-        counts = {
-            'ilr_in_uk_days': 0,
-            'short_trip_days': 0,
-            'no_visa_coverage_days': 0,
-            'ilr_total_days': 0,
-            'long_trip_days': 0,
-            'pre_entry_days': 0
-        }
         
-        for day in self.timeline.days.values():
-            if day.counts_as_ilr_in_uk_day(first_entry):
-                counts['ilr_in_uk_days'] += 1
-            elif day.counts_as_short_trip_day(first_entry):
-                counts['short_trip_days'] += 1
-            elif day.counts_as_no_visa_coverage_day(first_entry):
-                counts['no_visa_coverage_days'] += 1
-            elif day.counts_as_long_trip_day(first_entry):
-                counts['long_trip_days'] += 1
-            elif day.date < first_entry:
-                counts['pre_entry_days'] += 1
-        
-        counts['ilr_total_days'] = counts['ilr_in_uk_days'] + counts['short_trip_days'] + counts['no_visa_coverage_days']
+        # Reuse the last result if no day has changed since it was computed
+        cache_key = (self.timeline.version, first_entry)
+        if self._ilr_counts_total_key == cache_key:
+            return self._ilr_counts_total
+        
+        timeline = self.timeline
+        counts = self._ilr_counts_for_range(date(timeline.start_year, 1, 1), date(timeline.end_year, 12, 31))
+        
+        self._ilr_counts_total = counts
+        self._ilr_counts_total_key = cache_key
         return counts
     
+    def _ilr_counts_for_range(self, start_date: date, end_date: date) -> ILRCounts:
+        """
+        Count ILR-specific days in a date range (inclusive, clipped to the timeline).
+        
+        Days before first_entry_date all count as pre-entry, so that part is just the
+        clipped range length; the rest are split by classification using the
+        timeline's per-range classification counts. No Day objects are built or walked.
+        
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range
+            
+        Returns:
+            ILRCounts for the range (get_ilr_counts_* return it as a dict)
+        """
+        first_entry = self.config.first_entry_date_obj
+        
+        # Pre-entry part: every day before first entry, whatever its classification,
+        # so only its length is needed
+        pre_entry_end = min(end_date, first_entry - timedelta(days=1))
+        pre_entry_days = self.timeline.get_days_count_for_date_range(start_date, pre_entry_end)
+        
+        # Counted part: from first entry (or range start) onwards
+        class_counts = self.timeline.get_classification_counts_for_date_range(max(start_date, first_entry), end_date)
+        
+        in_uk_days = class_counts[DayClassification.UK_RESIDENCE]
+        short_trip_days = class_counts[DayClassification.SHORT_TRIP]
+        no_visa_coverage_days = class_counts[DayClassification.NO_VISA_COVERAGE]
+        return ILRCounts(
+            ilr_in_uk_days=in_uk_days,
+            short_trip_days=short_trip_days,
+            no_visa_coverage_days=no_visa_coverage_days,
+            ilr_total_days=in_uk_days + short_trip_days + no_visa_coverage_days,
+            long_trip_days=class_counts[DayClassification.LONG_TRIP],
+            pre_entry_days=pre_entry_days
+        )
+    
     def get_ilr_counts_for_month(self, year: int, month: int) -> Dict[str, int]:
         """
         Get ILR-specific day counts for a specific month.
         Uses first_entry_date from config to determine qualifying days.
         """
-        first_entry = self.config.first_entry_date_obj
-        counts = {
-            'ilr_in_uk_days': 0,
-            'short_trip_days': 0,
-            'no_visa_coverage_days': 0,
-            'ilr_total_days': 0,
-            'long_trip_days': 0,
-            'pre_entry_days': 0
-        }
-        
-        month_days = self.timeline.get_days_in_month(year, month)
-        for day in month_days:
-            if day.counts_as_ilr_in_uk_day(first_entry):
-                counts['ilr_in_uk_days'] += 1
-            elif day.counts_as_short_trip_day(first_entry):
-                counts['short_trip_days'] += 1
-            elif day.counts_as_no_visa_coverage_day(first_entry):
-                counts['no_visa_coverage_days'] += 1
-            elif day.counts_as_long_trip_day(first_entry):
-                counts['long_trip_days'] += 1
-            elif day.date < first_entry:
-                counts['pre_entry_days'] += 1
-        
-        counts['ilr_total_days'] = counts['ilr_in_uk_days'] + counts['short_trip_days'] + counts['no_visa_coverage_days']
-        return counts
+        return self._ilr_counts_for_range(date(year, month, 1), _last_day_of_month(year, month))._asdict()
     
     def get_ilr_counts_for_year(self, year: int) -> Dict[str, int]:
         """
         Get ILR-specific day counts for a specific year.
         Uses first_entry_date from config to determine qualifying days.
         """
-        first_entry = self.config.first_entry_date_obj
-        counts = {
-            'ilr_in_uk_days': 0,
-            'short_trip_days': 0,
-            'no_visa_coverage_days': 0,
-            'ilr_total_days': 0,
-            'long_trip_days': 0,
-            'pre_entry_days': 0
-        }
-        
-        year_days = self.timeline.get_days_in_year(year)
-        for day in year_days:
-            if day.counts_as_ilr_in_uk_day(first_entry):
-                counts['ilr_in_uk_days'] += 1
-            elif day.counts_as_short_trip_day(first_entry):
-                counts['short_trip_days'] += 1
-            elif day.counts_as_no_visa_coverage_day(first_entry):
-                counts['no_visa_coverage_days'] += 1
-            elif day.counts_as_long_trip_day(first_entry):
-                counts['long_trip_days'] += 1
-            elif day.date < first_entry:
-                counts['pre_entry_days'] += 1
-        
-        counts['ilr_total_days'] = counts['ilr_in_uk_days'] + counts['short_trip_days'] + counts['no_visa_coverage_days']
-        return counts
+        return self._ilr_counts_for_range(date(year, 1, 1), date(year, 12, 31))._asdict()
     
     def get_ilr_counts_for_date_range(self, start_date: date, end_date: date) -> Dict[str, int]:
         """
         Get ILR-specific day counts for a specific date range.
         Uses first_entry_date from config to determine qualifying days.
         """
-        first_entry = self.config.first_entry_date_obj
-        counts = {
-            'ilr_in_uk_days': 0,
-            'short_trip_days': 0,
-            'no_visa_coverage_days': 0,
-            'ilr_total_days': 0,
-            'long_trip_days': 0,
-            'pre_entry_days': 0
-        }
-        
-        current_date = start_date
-        while current_date <= end_date:
-            day_obj = self.timeline.get_day(current_date)
-            if day_obj:
-                if day_obj.counts_as_ilr_in_uk_day(first_entry):
-                    counts['ilr_in_uk_days'] += 1
-                elif day_obj.counts_as_short_trip_day(first_entry):
-                    counts['short_trip_days'] += 1
-                elif day_obj.counts_as_no_visa_coverage_day(first_entry):
-                    counts['no_visa_coverage_days'] += 1
-                elif day_obj.counts_as_long_trip_day(first_entry):
-                    counts['long_trip_days'] += 1
-                elif day_obj.date < first_entry:
-                    counts['pre_entry_days'] += 1
-            current_date += timedelta(days=1)
-        
-        counts['ilr_total_days'] = counts['ilr_in_uk_days'] + counts['short_trip_days'] + counts['no_visa_coverage_days']
-        return counts
\ No newline at end of file
+        return self._ilr_counts_for_range(start_date, end_date)._asdict()
\ No newline at end of file
@@ -3,19 +3,56 @@ Date Timeline Management for Calendar App
 Contains DateTimeline class for managing configurable day-by-day timeline for ILR tracking.
 """
 
+from collections.abc import Mapping
 from datetime import date, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from calendar_app.config import AppConfig
-from calendar_app.model.day import Day, DayClassification
+from calendar_app.model.day import CLASSIFICATIONS, CLASSIFICATION_IDS, Day, DayClassification, DayStore, format_date
 from calendar_app.model.trips import TripClassifier
 from calendar_app.model.visaPeriods import VisaClassifier
 
 
+class _TimelineDays(Mapping):
+    """
+    Read-only date -> Day mapping over a DateTimeline's day store.
+    
+    Preserves the public `timeline.days` dict interface; Day views are
+    created on access rather than stored per day.
+    """
+    
+    def __init__(self, timeline: 'DateTimeline'):
+        self._timeline = timeline
+    
+    def __getitem__(self, date_obj: date) -> Day:
+        day_obj = self._timeline.get_day(date_obj)
+        if day_obj is None:
+            raise KeyError(date_obj)
+        return day_obj
+    
+    def __contains__(self, date_obj: object) -> bool:
+        return isinstance(date_obj, date) and self._timeline.get_day(date_obj) is not None
+    
+    def __iter__(self) -> Iterator[date]:
+        base_ordinal = self._timeline._base_ordinal
+        return map(date.fromordinal, range(base_ordinal, base_ordinal + len(self)))
+    
+    def __len__(self) -> int:
+        return len(self._timeline._cls)
+
+
 class DateTimeline:
-    """Manages the complete day-by-day timeline for a specified date range."""
+    """
+    Manages the complete day-by-day timeline for a specified date range.
+    
+    Days are stored struct-of-arrays in a DayStore indexed by day offset
+    (date.toordinal() - _base_ordinal): one classification byte per day in
+    `_cls` plus parallel metadata lists. Day objects are lightweight views
+    created on demand by get_day().
+    """
     
     _instance: Optional['DateTimeline'] = None  # Class-level singleton instance
+    _instance_key: Optional[Tuple[int, int, date]] = None  # (start_year, end_year, first_entry_date) the singleton was built for
     
     def __init__(self, config: AppConfig, trip_classifier: 'TripClassifier', visaPeriod_classifier: 'VisaClassifier'):
         """
@@ -40,9 +77,33 @@ class DateTimeline:
         self.config = config
         self.trip_classifier = trip_classifier
         self.visaPeriod_classifier = visaPeriod_classifier
-        self.days: Dict[date, Day] = {}
+        
+        # Day offset 0 is 1 January of start_year
+        self._base_ordinal = date(self.start_year, 1, 1).toordinal()
+        total_days = date(self.end_year, 12, 31).toordinal() - self._base_ordinal + 1
+        self._store = DayStore(total_days)
+        self._cls = self._store.classes  # Classification id per day offset
+        
+        # Day views by day offset, created on first access and then reused, so
+        # repeated lookups are a list index rather than a new object each time
+        self._views: List[Optional[Day]] = [None] * total_days
+        
+        # Memoized whole-timeline counts, valid while the store version is unchanged
+        self._counts_total: Optional[Dict[DayClassification, int]] = None
+        self._counts_total_version = -1
+        
         self._generate_timeline()
     
+    @property
+    def version(self) -> int:
+        """Mutation counter - changes whenever any day's classification changes."""
+        return self._store.version
+    
+    @property
+    def days(self) -> Mapping:
+        """Read-only date -> Day mapping of every day in the timeline."""
+        return _TimelineDays(self)
+    
     @classmethod
     def from_config(cls, config: AppConfig, trip_classifier: 'TripClassifier', visaPeriod_classifier: 'VisaClassifier', use_singleton: bool = True) -> 'DateTimeline':
         """
@@ -53,6 +114,7 @@ class DateTimeline:
             trip_classifier: TripClassifier for real trip data integration (required)
             visaPeriod_classifier: VisaClassifier for visa period data integration (required)
             use_singleton: If True, reuse existing instance with matching config
+                (same start_year, end_year and first_entry_date)
             
         Returns:
             DateTimeline instance
@@ -60,13 +122,19 @@ class DateTimeline:
         Raises:
             ValueError: If singleton exists with different config and use_singleton=True
         """
+        # Everything the day classification depends on; a changed first entry date
+        # would otherwise hand back a timeline with stale pre-entry days
+        key = (config.start_year, config.end_year, config.first_entry_date_obj)
+        
         if use_singleton and cls._instance is not None:
             # Check if existing instance matches requested config
-            if (cls._instance.start_year != config.start_year or 
-                cls._instance.end_year != config.end_year):
+            if cls._instance_key != key:
+                start_year, end_year, first_entry = cls._instance_key
                 raise ValueError(
-                    f"Timeline instance exists with range {cls._instance.start_year}-{cls._instance.end_year}, "
-                    f"cannot create with different range {config.start_year}-{config.end_year}. "
+                    f"Timeline instance exists with range {start_year}-{end_year} "
+                    f"(first entry {format_date(first_entry)}), "
+                    f"cannot create with different range {config.start_year}-{config.end_year} "
+                    f"(first entry {format_date(config.first_entry_date_obj)}). "
                     f"Use use_singleton=False or call reset_singleton() first."
                 )
             return cls._instance
@@ -74,117 +142,171 @@ class DateTimeline:
         instance = cls(config, trip_classifier, visaPeriod_classifier)
         if use_singleton:
             cls._instance = instance
+            cls._instance_key = key
         return instance
     
     @classmethod
     def reset_singleton(cls) -> None:
         """Reset the singleton instance (useful for testing)."""
         cls._instance = None
+        cls._instance_key = None
     
-    def _classify_day_from_trip_data(self, current_date: date, trip_classifier: 'TripClassifier') -> DayClassification:
+    def _first_entry_offset(self) -> int:
         """
-        Classify a day based on trip data from TripClassifier and visa coverage.
+        Day offset of the config's current first entry date.
+        
+        Read from the config on each call so a reloaded first entry date is
+        honoured; clamped to the timeline bounds so it can be used as a slice index.
+        
+        Returns:
+            Offset in [0, total days] of the first ILR-qualifying day
+        """
+        offset = self.config.first_entry_date_obj.toordinal() - self._base_ordinal
+        return min(max(offset, 0), len(self._cls))
+    
+    def _classify_day(self, index: int, first_entry_index: int, trip_info: Optional[Dict],
+                      has_visaPeriod: bool) -> DayClassification:
+        """
+        Classify a day from lookups the caller has already performed.
+        
+        Pure function of its arguments - the trip and visa lookups are done once
+        per day by _generate_timeline and shared with the Day metadata, instead
+        of each predicate (short/long/visa) repeating its own dict lookup.
         
         Args:
-            current_date: Date to classify
-            trip_classifier: TripClassifier instance
+            index: Day offset of the date to classify
+            first_entry_index: Day offset of the first ILR-qualifying day
+            trip_info: Raw trip dictionary covering the date, or None
+            has_visaPeriod: True if the date is covered by a visa period
             
         Returns:
             DayClassification for the date
         """
         # Handle pre-entry days
-        if current_date < self.config.first_entry_date_obj:
+        if index < first_entry_index:
             return DayClassification.PRE_ENTRY
         
         # Check if day is part of any trip
-        if trip_classifier.is_short_trip_day(current_date):
-            return DayClassification.SHORT_TRIP
-        elif trip_classifier.is_long_trip_day(current_date):
+        if trip_info is not None:
+            if trip_info.get("is_short_trip", False):
+                return DayClassification.SHORT_TRIP
             return DayClassification.LONG_TRIP
-        else:
-            # Not part of any trip = UK residence day
-            # Check if day has visa coverage
-            visaPeriod_summary = self.visaPeriod_classifier.get_visaPeriod_summary(current_date)
-            if visaPeriod_summary['has_visaPeriod']:
-                return DayClassification.UK_RESIDENCE
-            else:
-                # UK residence day without visa coverage - counts toward ILR but tracked separately
-                return DayClassification.NO_VISA_COVERAGE
+        
+        # Not part of any trip = UK residence day
+        if has_visaPeriod:
+            return DayClassification.UK_RESIDENCE
+        # UK residence day without visa coverage - counts toward ILR but tracked separately
+        return DayClassification.NO_VISA_COVERAGE
 
     def _generate_timeline(self) -> None:
-        """Generate all days based on configured date range and classify them."""
-        start_date = date(self.start_year, 1, 1)
-        end_date = date(self.end_year, 12, 31)
-        
-        current_date = start_date
-        while current_date <= end_date:
-            day_obj = Day(current_date)
+        """Classify every day of the configured date range into the day store."""
+        # Bind hot lookups to locals once - this loop runs once per day of a
+        # multi-year range, so attribute chains here are the dominant cost
+        classes = self._cls
+        trip_infos = self._store.trip_info
+        visaPeriod_infos = self._store.visaPeriod_info
+        classify_day = self._classify_day
+        # First ILR-qualifying day as a day offset, so per-day pre-entry checks
+        # are integer comparisons instead of date comparisons
+        first_entry_index = self._first_entry_offset()
+        get_day_trip_info = self.trip_classifier.get_day_trip_info
+        get_trip_summary = self.trip_classifier.get_trip_summary
+        get_visaPeriod_summary = self.visaPeriod_classifier.get_visaPeriod_summary
+        
+        for index, ordinal in enumerate(range(self._base_ordinal, self._base_ordinal + len(classes))):
+            current_date = date.fromordinal(ordinal)
             
-            # Set day classification using trip data (trip_classifier is always present)
-            day_obj.classification = self._classify_day_from_trip_data(current_date, self.trip_classifier)
+            # One trip lookup and one visa lookup per day, shared between the
+            # classification and the stored metadata
+            trip_info = get_day_trip_info(current_date)
+            visaPeriod_summary = get_visaPeriod_summary(current_date)
+            has_visaPeriod = visaPeriod_summary['has_visaPeriod']
             
-            # Store trip information if this is a trip day
-            trip_summary = self.trip_classifier.get_trip_summary(current_date)
-            if trip_summary['is_trip_day']:
-                day_obj.trip_info = trip_summary
+            classes[index] = CLASSIFICATION_IDS[classify_day(index, first_entry_index, trip_info, has_visaPeriod)]
+            
+            # Store trip information if this is a trip day (summary dict is only
+            # built for the minority of days that fall inside a trip)
+            if trip_info is not None:
+                trip_summary = get_trip_summary(current_date)
+                if trip_summary['is_trip_day']:
+                    trip_infos[index] = trip_summary
             
             # Store visa period information if this day has visa period coverage
-            visaPeriod_summary = self.visaPeriod_classifier.get_visaPeriod_summary(current_date)
-            if visaPeriod_summary['has_visaPeriod']:
-                day_obj.visaPeriod_info = visaPeriod_summary
+            if has_visaPeriod:
+                visaPeriod_infos[index] = visaPeriod_summary
+    
+    def _index_range(self, start_date: date, end_date: date) -> range:
+        """
+        Day offsets covered by a date range (inclusive), clipped to the timeline.
+        
+        Args:
+            start_date: Range start date (inclusive)
+            end_date: Range end date (inclusive)
             
-            self.days[current_date] = day_obj
-            current_date += timedelta(days=1)
+        Returns:
+            range of day offsets into the day store (empty if no overlap)
+        """
+        start_index = max(0, start_date.toordinal() - self._base_ordinal)
+        end_index = min(len(self._cls), end_date.toordinal() - self._base_ordinal + 1)
+        return range(start_index, max(start_index, end_index))
+    
+    def _count_classes(self, start_index: int, end_index: int) -> Dict[DayClassification, int]:
+        """
+        Count each classification over day offsets [start_index, end_index).
+        
+        Each count is a single bytearray.count() - a C-level scan of the
+        classification bytes, with no per-day Python objects involved.
+        """
+        classes = self._cls
+        return {classification: classes.count(class_id, start_index, end_index)
+                for class_id, classification in enumerate(CLASSIFICATIONS)}
     
     def get_day(self, date_obj: date) -> Optional[Day]:
-        """Get a specific day from the timeline."""
-        return self.days.get(date_obj)
+        """Get a specific day from the timeline (a view onto the day store)."""
+        index = date_obj.toordinal() - self._base_ordinal
+        if 0 <= index < len(self._views):
+            view = self._views[index]
+            if view is None:
+                view = self._views[index] = Day(date_obj, self._store, index)
+            return view
+        return None
+    
+    def _days_at(self, indices: Iterable[int]) -> List[Day]:
+        """Get Day views for a sequence of day offsets, creating any not yet built."""
+        views = self._views
+        store = self._store
+        base_ordinal = self._base_ordinal
+        days = []
+        for index in indices:
+            view = views[index]
+            if view is None:
+                view = views[index] = Day(date.fromordinal(base_ordinal + index), store, index)
+            days.append(view)
+        return days
     
     def get_days_in_month(self, year: int, month: int) -> List[Day]:
         """Get all days for a specific month."""
-        days_in_month = []
-        
-        # Get first day of month
+        # First day of the month and first day of the following month
         first_day = date(year, month, 1)
+        next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
         
-        # Get last day of month
-        if month == 12:
-            last_day = date(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            last_day = date(year, month + 1, 1) - timedelta(days=1)
-        
-        current_date = first_day
-        while current_date <= last_day:
-            day_obj = self.get_day(current_date)
-            if day_obj:
-                days_in_month.append(day_obj)
-            current_date += timedelta(days=1)
-        
-        return days_in_month
+        return self._days_at(self._index_range(first_day, next_month - timedelta(days=1)))
     
     def get_days_in_year(self, year: int) -> List[Day]:
         """Get all days for a specific year."""
-        days_in_year = []
-        start_date = date(year, 1, 1)
-        end_date = date(year, 12, 31)
-        
-        current_date = start_date
-        while current_date <= end_date:
-            day_obj = self.get_day(current_date)
-            if day_obj:
-                days_in_year.append(day_obj)
-            current_date += timedelta(days=1)
-        
-        return days_in_year
+        return self._days_at(self._index_range(date(year, 1, 1), date(year, 12, 31)))
     
     def is_date_in_range(self, date_obj: date) -> bool:
         """Check if a date is within the supported timeline range."""
-        return (self.start_year <= date_obj.year <= self.end_year and 
-                date_obj in self.days)
+        return 0 <= date_obj.toordinal() - self._base_ordinal < len(self._cls)
     
     def get_total_days(self) -> int:
         """Get total number of days in timeline."""
-        return len(self.days)
+        return len(self._cls)
+    
+    def get_days_count_for_date_range(self, start_date: date, end_date: date) -> int:
+        """Get number of timeline days in a date range (inclusive), without scanning them."""
+        return len(self._index_range(start_date, end_date))
     
     def get_date_range_info(self) -> Dict[str, date]:
         """Get information about the timeline date range."""
@@ -194,42 +316,58 @@ class DateTimeline:
             'total_days': self.get_total_days()
         }
     
+    def _update_index(self, index: int, classification: DayClassification,
+                      trip_info: Optional[Dict], visaPeriod: Optional[str]) -> None:
+        """Update classification and info for the day at a day offset."""
+        self._cls[index] = CLASSIFICATION_IDS[classification]
+        self._store.version += 1
+        if trip_info:
+            self._store.trip_info[index] = trip_info
+        if visaPeriod:
+            self._store.visaPeriod[index] = visaPeriod
+    
     def update_day_classification(self, date_obj: date, classification: DayClassification,
                                 trip_info: Optional[Dict] = None, 
                                 visaPeriod: Optional[str] = None) -> bool:
         """Update classification and info for a specific day."""
-        day_obj = self.get_day(date_obj)
-        if day_obj:
-            day_obj.classification = classification
-            if trip_info:
-                day_obj.trip_info = trip_info
-            if visaPeriod:
-                day_obj.visaPeriod = visaPeriod
+        index = date_obj.toordinal() - self._base_ordinal
+        if 0 <= index < len(self._cls):
+            self._update_index(index, classification, trip_info, visaPeriod)
             return True
         return False
     
     def get_days_by_classification(self, classification: DayClassification) -> List[Day]:
         """Get all days with a specific classification."""
-        return [day for day in self.days.values() if day.classification == classification]
+        return self._days_at(self._indices_of_class(CLASSIFICATION_IDS[classification]))
+    
+    def _indices_of_class(self, class_id: int) -> List[int]:
+        """
+        Day offsets holding a classification id, in date order.
+        
+        Each bytearray.find() is a C-level memchr over the classification bytes
+        that jumps straight to the next match, so rare classes cost close to
+        the number of matching days rather than a Python-level pass over all days.
+        """
+        classes = self._cls
+        indices = []
+        index = classes.find(class_id)
+        while index != -1:
+            indices.append(index)
+            index = classes.find(class_id, index + 1)
+        return indices
     
     def get_classification_counts_total(self) -> Dict[DayClassification, int]:
         """Get counts of each classification type across the entire timeline."""
-        counts = {classification: 0 for classification in DayClassification}
-        
-        for day in self.days.values():
-            counts[day.classification] += 1
-            
-        return counts
+        # Recount only if a day changed since the last call (O(1) on repeated calls)
+        if self._counts_total_version != self._store.version:
+            self._counts_total = self._count_classes(0, len(self._cls))
+            self._counts_total_version = self._store.version
+        return dict(self._counts_total)
     
     def get_classification_counts_for_month(self, year: int, month: int) -> Dict[DayClassification, int]:
         """Get counts of each classification type for a specific month."""
-        counts = {classification: 0 for classification in DayClassification}
-        
-        month_days = self.get_days_in_month(year, month)
-        for day in month_days:
-            counts[day.classification] += 1
-            
-        return counts
+        next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+        return self.get_classification_counts_for_date_range(date(year, month, 1), next_month - timedelta(days=1))
     
     def get_year_day_colors(self, year: int, color_mapping: Dict[DayClassification, str], 
                            first_entry_date: Optional[date] = None, 
@@ -249,44 +387,35 @@ class DateTimeline:
         """
         year_colors = {}
         
-        # Get all days for the year in batch
-        year_days = self.get_days_in_year(year)
+        # Color per classification id, so the loop reads raw classification bytes
+        # without building a Day view per day
+        id_colors = [color_mapping.get(classification, default_color) for classification in CLASSIFICATIONS]
+        first_entry_ordinal = first_entry_date.toordinal() if first_entry_date else None
+        
+        indices = self._index_range(date(year, 1, 1), date(year, 12, 31))
+        base_ordinal = self._base_ordinal
+        classes = self._cls
         
-        for day_obj in year_days:
-            day_date = day_obj.date
+        for index in indices:
+            ordinal = base_ordinal + index
             
             # Check pre-entry first
-            if first_entry_date and day_date < first_entry_date:
-                year_colors[day_date] = pre_entry_color
-            elif hasattr(day_obj, 'classification') and day_obj.classification in color_mapping:
-                year_colors[day_date] = color_mapping[day_obj.classification]
+            if first_entry_ordinal is not None and ordinal < first_entry_ordinal:
+                color = pre_entry_color
             else:
-                year_colors[day_date] = default_color
+                color = id_colors[classes[index]]
+            year_colors[date.fromordinal(ordinal)] = color
                 
         return year_colors
     
     def get_classification_counts_for_year(self, year: int) -> Dict[DayClassification, int]:
         """Get counts of each classification type for a specific year."""
-        counts = {classification: 0 for classification in DayClassification}
-        
-        year_days = self.get_days_in_year(year)
-        for day in year_days:
-            counts[day.classification] += 1
-            
-        return counts
+        return self.get_classification_counts_for_date_range(date(year, 1, 1), date(year, 12, 31))
     
     def get_classification_counts_for_date_range(self, start_date: date, end_date: date) -> Dict[DayClassification, int]:
         """Get counts of each classification type for a specific date range."""
-        counts = {classification: 0 for classification in DayClassification}
-        
-        current_date = start_date
-        while current_date <= end_date:
-            day_obj = self.get_day(current_date)
-            if day_obj:
-                counts[day_obj.classification] += 1
-            current_date += timedelta(days=1)
-            
-        return counts
+        indices = self._index_range(start_date, end_date)
+        return self._count_classes(indices.start, indices.stop)
     
     
     def update_date_range_classification(self, start_date: date, end_date: date, 
@@ -300,14 +429,42 @@ class DateTimeline:
         Returns:
             Number of days successfully updated
         """
-        updated_count = 0
-        current_date = start_date
-        
-        while current_date <= end_date:
-            if self.update_day_classification(current_date, classification, trip_info, visaPeriod):
-                updated_count += 1
-            current_date += timedelta(days=1)
+        indices = self._index_range(start_date, end_date)
+        i0, i1 = indices.start, indices.stop
+        count = i1 - i0
+        if count <= 0:
+            return 0
+        
+        # One slice assignment per array (like memset) instead of a per-day update
+        store = self._store
+        self._cls[i0:i1] = bytes([CLASSIFICATION_IDS[classification]]) * count
+        store.version += 1
+        if trip_info:
+            store.trip_info[i0:i1] = [trip_info] * count
+        if visaPeriod:
+            store.visaPeriod[i0:i1] = [visaPeriod] * count
             
+        return count
+    
+    def _classify_unknown_in_range(self, start_index: int, end_index: int,
+                                   classification: DayClassification) -> int:
+        """
+        Reclassify every UNKNOWN day in offsets [start_index, end_index).
+        
+        Done as one masked update over the classification bytes:
+        bytes.translate() maps the UNKNOWN id to the new id and leaves every other
+        byte alone, all in C (like a single SIMD pass instead of a per-day loop).
+        
+        Returns:
+            Number of days reclassified
+        """
+        classes = self._cls
+        unknown_id = CLASSIFICATION_IDS[DayClassification.UNKNOWN]
+        updated_count = classes.count(unknown_id, start_index, end_index)
+        if updated_count:
+            table = bytes.maketrans(bytes((unknown_id,)), bytes((CLASSIFICATION_IDS[classification],)))
+            classes[start_index:end_index] = classes[start_index:end_index].translate(table)
+            self._store.version += 1
         return updated_count
     
     def classify_pre_entry_days(self) -> int:
@@ -317,15 +474,7 @@ class DateTimeline:
         Returns:
             Number of days classified as pre-entry
         """
-        first_entry = self.config.first_entry_date_obj
-        updated_count = 0
-        
-        for day in self.days.values():
-            if day.date < first_entry and day.classification == DayClassification.UNKNOWN:
-                day.classification = DayClassification.PRE_ENTRY
-                updated_count += 1
-                
-        return updated_count
+        return self._classify_unknown_in_range(0, self._first_entry_offset(), DayClassification.PRE_ENTRY)
     
     def auto_classify_all_days(self) -> Dict[str, int]:
         """
@@ -340,14 +489,9 @@ class DateTimeline:
         
         # Then classify all remaining UNKNOWN days as UK_RESIDENCE
         # (Trip days will be classified when trip data is loaded)
-        first_entry = self.config.first_entry_date_obj
-        uk_residence_count = 0
-        
-        for day in self.days.values():
-            if (day.date >= first_entry and 
-                day.classification == DayClassification.UNKNOWN):
-                day.classification = DayClassification.UK_RESIDENCE
-                uk_residence_count += 1
+        uk_residence_count = self._classify_unknown_in_range(
+            self._first_entry_offset(), len(self._cls), DayClassification.UK_RESIDENCE
+        )
         
         return {
             'pre_entry_classified': pre_entry_count,
@@ -366,11 +510,12 @@ class DateTimeline:
         Raises:
             ValueError: If any days remain UNKNOWN (in strict mode)
         """
-        unknown_days = self.get_days_by_classification(DayClassification.UNKNOWN)
+        unknown_id = CLASSIFICATION_IDS[DayClassification.UNKNOWN]
+        first_unknown_index = self._cls.find(unknown_id)
         
-        if unknown_days:
-            unknown_count = len(unknown_days)
-            first_unknown = unknown_days[0].date.strftime('%d-%m-%Y')
+        if first_unknown_index != -1:
+            unknown_count = self._cls.count(unknown_id)
+            first_unknown = format_date(date.fromordinal(self._base_ordinal + first_unknown_index))
             raise ValueError(
                 f"Timeline validation failed: {unknown_count} days remain UNKNOWN. "
                 f"First unknown day: {first_unknown}. All days must be classified before use."
@@ -412,14 +557,14 @@ class DateTimeline:
             # Calculate classification counts for date range
             classification_counts = self.get_classification_counts_for_date_range(actual_start_date, actual_end_date)
             total_days = sum(classification_counts.values())
-            date_range_description = f"{actual_start_date.strftime('%d-%m-%Y')} to {actual_end_date.strftime('%d-%m-%Y')}"
+            date_range_description = f"{format_date(actual_start_date)} to {format_date(actual_end_date)}"
         
         # Build main result (always visible)
         result = {
             'total_days': total_days,
             'date_range': date_range_description,
-            'actual_start_date': actual_start_date.strftime('%d-%m-%Y'),
-            'actual_end_date': actual_end_date.strftime('%d-%m-%Y'),
+            'actual_start_date': format_date(actual_start_date),
+            'actual_end_date': format_date(actual_end_date),
             'classification_counts': {k.value: v for k, v in classification_counts.items()}
         }
         
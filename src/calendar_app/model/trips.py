@@ -5,7 +5,7 @@ Handles mapping of trips from JSON data to daily timeline and determines
 day-by-day classifications based on ILR business rules.
 """
 
-from datetime import date, timedelta
+from datetime import date
 from typing import Dict, List, Optional, Tuple
 from calendar_app.config import AppConfig
 
@@ -30,6 +30,11 @@ class TripClassifier:
         """
         self.config = config
         self.trips_data = trips_data
+        # Struct-of-arrays view of trip bounds as day ordinals, parallel to
+        # trips_data - range queries compare plain ints instead of walking
+        # dicts and comparing date objects
+        self._start_ordinals: List[int] = [trip["departure_date_obj"].toordinal() for trip in trips_data]
+        self._end_ordinals: List[int] = [trip["return_date_obj"].toordinal() for trip in trips_data]
         self._trip_day_map: Dict[date, Dict] = self._build_trip_day_map()
         
     def _build_trip_day_map(self) -> Dict[date, Dict]:
@@ -40,14 +45,12 @@ class TripClassifier:
             Dictionary mapping date -> trip data (or None for UK residence days)
         """            
         trip_day_map = {}
+        fromordinal = date.fromordinal
         
-        for trip in self.trips_data:
-            departure_date = trip["departure_date_obj"]
-            return_date = trip["return_date_obj"]
-            
+        for trip, start_ordinal, end_ordinal in zip(self.trips_data, self._start_ordinals, self._end_ordinals):
             # Map each day of the trip to trip information
-            current_date = departure_date
-            while current_date <= return_date:
+            for ordinal in range(start_ordinal, end_ordinal + 1):
+                current_date = fromordinal(ordinal)
                 if current_date in trip_day_map:
                     raise ValueError(
                         f"Date {current_date.strftime('%d-%m-%Y')} appears in multiple trips: "
@@ -55,9 +58,6 @@ class TripClassifier:
                     )
                 trip_day_map[current_date] = trip
                 
-                # Move to next day
-                current_date += timedelta(days=1)
-                
         return trip_day_map
         
     def get_day_trip_info(self, target_date: date) -> Optional[Dict]:
@@ -167,15 +167,15 @@ class TripClassifier:
         Returns:
             List of trips that overlap with the date range
         """
-        overlapping_trips = []
+        start_ordinal = start_date.toordinal()
+        end_ordinal = end_date.toordinal()
         
-        for trip in self.trips_data:
-            trip_start = trip["departure_date_obj"]
-            trip_end = trip["return_date_obj"]
-            
-            # Check for date range overlap
-            if trip_start <= end_date and trip_end >= start_date:
-                overlapping_trips.append(trip)
+        # Check for date range overlap on the ordinal arrays
+        overlapping_trips = [
+            trip for trip, trip_start, trip_end
+            in zip(self.trips_data, self._start_ordinals, self._end_ordinals)
+            if trip_start <= end_ordinal and trip_end >= start_ordinal
+        ]
                 
         return overlapping_trips
         
@@ -31,6 +31,10 @@ class VisaClassifier:
         """
         self.config = config
         self.visaPeriods_data = visaPeriods_data
+        # Struct-of-arrays view of period bounds as day ordinals, parallel to
+        # visaPeriods_data - range queries compare plain ints
+        self._start_ordinals: List[int] = [p["start_date_obj"].toordinal() for p in visaPeriods_data]
+        self._end_ordinals: List[int] = [p["end_date_obj"].toordinal() for p in visaPeriods_data]
         self._visaPeriod_day_map: Dict[date, Dict] = self._build_visaPeriod_day_map()
         
     def _build_visaPeriod_day_map(self) -> Dict[date, Dict]:
@@ -218,15 +222,15 @@ class VisaClassifier:
         Returns:
             List of visa periods that overlap with the date range
         """
-        overlapping_periods = []
+        start_ordinal = start_date.toordinal()
+        end_ordinal = end_date.toordinal()
         
-        for visaPeriod in self.visaPeriods_data:
-            period_start = visaPeriod["start_date_obj"]
-            period_end = visaPeriod["end_date_obj"]
-            
-            # Check for date range overlap
-            if period_start <= end_date and period_end >= start_date:
-                overlapping_periods.append(visaPeriod)
+        # Check for date range overlap on the ordinal arrays
+        overlapping_periods = [
+            visaPeriod for visaPeriod, period_start, period_end
+            in zip(self.visaPeriods_data, self._start_ordinals, self._end_ordinals)
+            if period_start <= end_ordinal and period_end >= start_ordinal
+        ]
                 
         return overlapping_periods
         
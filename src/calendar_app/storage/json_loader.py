@@ -10,9 +10,19 @@ from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
 from calendar_app.config import AppConfig
 
+# Module-level cache of parsed JSON data files
+# Maps file_path -> (st_mtime_ns, st_size, parsed data)
+# A changed modification time or size invalidates the entry automatically
+_JSON_CACHE: Dict[Path, Tuple[int, int, List[Dict[str, Any]]]] = {}
+
 class DataLoader:
     """Loads and validates JSON data files."""
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the parsed JSON file cache (useful for testing)."""
+        _JSON_CACHE.clear()
+        
     def __init__(self, project_root: Path, config: AppConfig):
         """
         Initialize data loader.
@@ -45,6 +55,12 @@ class DataLoader:
             raise FileNotFoundError(f"Data file not found: {file_path}")
             
         try:
+            # Reuse previous parse if the file is unchanged since it was read
+            st = file_path.stat()
+            cached = _JSON_CACHE.get(file_path)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return cached[2]
+                
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 
@@ -52,6 +68,7 @@ class DataLoader:
             if not isinstance(data, list):
                 raise ValueError(f"{filename} must contain a JSON array")
                 
+            _JSON_CACHE[file_path] = (st.st_mtime_ns, st.st_size, data)
             return data
             
         except json.JSONDecodeError as e:
@@ -308,11 +325,13 @@ class DataLoader:
         
         total_trip_days = sum(trip.get("trip_length_days", 0) for trip in trips)
         
-        # Build summary text using f-string formatting (same pattern as main.py)
-        summary_text = f"""Data Summary:"""
-        summary_text += f"\n• {len(trips)} trips total ({short_trips} short, {long_trips} long)"
-        summary_text += f"\n• {total_trip_days} total trip days"
-        summary_text += f"\n• {len(visaPeriods)} visa periods"
-        summary_text += f"\n• Date range: {min(trip['departure_date'] for trip in trips) if trips else 'N/A'} to {max(trip['return_date'] for trip in trips) if trips else 'N/A'}"
+        # Build all lines first, then join once (same pattern as AppConfig.get_summary)
+        parts = [
+            "Data Summary:",
+            f"• {len(trips)} trips total ({short_trips} short, {long_trips} long)",
+            f"• {total_trip_days} total trip days",
+            f"• {len(visaPeriods)} visa periods",
+            f"• Date range: {min(trip['departure_date'] for trip in trips) if trips else 'N/A'} to {max(trip['return_date'] for trip in trips) if trips else 'N/A'}",
+        ]
         
-        return summary_text
\ No newline at end of file
+        return "\n".join(parts)
\ No newline at end of file
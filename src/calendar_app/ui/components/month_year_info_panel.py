@@ -13,7 +13,6 @@ from typing import Optional, Callable
 
 from calendar_app.model.timeline import DateTimeline
 from calendar_app.model.day import DayClassification
-from calendar_app.model.day import DayClassification
 
 
 class MonthYearInfoPanel(tk.Frame):
@@ -0,0 +1,46 @@
+"""
+Shared UI Fonts
+
+Named tkinter Font objects shared by the calendar modules.
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+from typing import Dict, Tuple
+from weakref import WeakKeyDictionary
+
+# Font family used throughout the calendar UI
+FONT_FAMILY = "Arial"
+
+# Shared fonts per Tk root window: root -> {(size, weight): Font}
+# Fonts belong to one Tcl interpreter, so each root gets its own set; the root
+# is held weakly so a destroyed root and its fonts can be garbage collected
+_FONTS: "WeakKeyDictionary[tk.Misc, Dict[Tuple[int, str], tkfont.Font]]" = WeakKeyDictionary()
+
+
+def ui_font(widget: tk.Misc, size: int, weight: str = "normal") -> tkfont.Font:
+    """
+    Get the shared Font object for a size and weight.
+    
+    A font tuple such as ("Arial", 9) is parsed and resolved by Tk again for
+    every widget that uses it; a Font object is resolved once and reused
+    (like creating an HFONT once with CreateFont() and selecting it into
+    every control).
+    
+    Args:
+        widget: Any widget of the window the font is used in (selects its Tk root)
+        size: Point size
+        weight: "normal" or "bold"
+        
+    Returns:
+        Shared tkinter Font instance for the widget's root window
+    """
+    root = widget.nametowidget(".")
+    fonts = _FONTS.get(root)
+    if fonts is None:
+        fonts = _FONTS[root] = {}
+    
+    font = fonts.get((size, weight))
+    if font is None:
+        font = fonts[(size, weight)] = tkfont.Font(root=root, family=FONT_FAMILY, size=size, weight=weight)
+    return font
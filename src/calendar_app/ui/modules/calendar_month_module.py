@@ -6,12 +6,13 @@ This replaces the old month_view.py from the views directory.
 """
 
 import tkinter as tk
-import calendar
-from datetime import date, timedelta, timedelta
+from datetime import date
 from typing import Optional, Callable
 
 from calendar_app.config import AppConfig
 from calendar_app.model.timeline import DateTimeline
+from calendar_app.ui.fonts import ui_font
+from calendar_app.ui.month_grid import month_grid
 
 
 class CalendarMonthModule(tk.Frame):
@@ -79,6 +80,12 @@ class CalendarMonthModule(tk.Frame):
         self.weekdays_frame = None
         self.days_frame = None
         
+        # Dirty-flag redraw protocol: data changes only mark the view dirty and
+        # schedule one idle redraw, so several changes in one event are coalesced
+        # (like InvalidateRect() + a single WM_PAINT in Win32)
+        self._dirty = True
+        self._redraw_pending = False
+        
         # Setup UI
         self.setup_calendar_grid()
         self.update_month_display()
@@ -106,7 +113,7 @@ class CalendarMonthModule(tk.Frame):
             header_label = tk.Label(
                 self.weekdays_frame, 
                 text=weekday, 
-                font=("Arial", 10, "bold"),
+                font=ui_font(self, 10, "bold"),
                 bg="#e9ecef",
                 relief=tk.RIDGE,
                 bd=1,
@@ -124,6 +131,32 @@ class CalendarMonthModule(tk.Frame):
             self.days_frame.grid_columnconfigure(i, weight=1, minsize=60)
         for i in range(6):  # 6 rows maximum for weeks
             self.days_frame.grid_rowconfigure(i, weight=1, minsize=40)
+        
+        # Create the 42 day cells once (6x7 grid) - month changes only reconfigure
+        # them, instead of destroying and recreating 42 widgets every time
+        # (like reusing window handles rather than CreateWindow/DestroyWindow)
+        self._cell_buttons = []
+        self._cell_dates = ()  # Date shown in each cell, set by update_month_display()
+        for week_idx in range(6):  # Always 6 rows
+            for day_idx in range(7):  # Always 7 columns
+                # Command is bound to the cell index once, so reconfiguring a cell
+                # never registers a new Tcl callback
+                day_button = tk.Button(
+                    self.days_frame,
+                    font=ui_font(self, 9),
+                    command=lambda i=week_idx * 7 + day_idx: self._on_cell_clicked(i),
+                    relief=tk.RIDGE,
+                    bd=1
+                )
+                day_button.grid(row=week_idx, column=day_idx, sticky="nsew", padx=0, pady=0)
+                self._cell_buttons.append(day_button)
+        
+        # Pristine highlight options, restored when a cell stops being a target date
+        first_cell = self._cell_buttons[0]
+        self._cell_defaults = {
+            option: first_cell.cget(option)
+            for option in ('highlightthickness', 'highlightbackground', 'highlightcolor')
+        }
     
     def set_current_date(self, new_date: date):
         """Set the current date and update display only if month/year changed."""
@@ -138,65 +171,29 @@ class CalendarMonthModule(tk.Frame):
     
     def update_month_display(self):
         """Update the calendar display for the current month."""
-        # Clear existing day buttons
-        for button in self.day_buttons.values():
-            button.destroy()
-        self.day_buttons.clear()
+        # Display now reflects current data - any pending idle redraw can be skipped
+        self._dirty = False
         
-        # Get calendar data using itermonthdates (like year view)
-        cal = calendar.Calendar(0)  # Monday as first day
-        month_days = list(cal.itermonthdates(self.current_date.year, self.current_date.month))
+        # Forget the previous month's date -> button mapping (cells are reused)
+        self.day_buttons.clear()
         
-        # Ensure exactly 42 days (6 weeks x 7 days) for consistent 7x6 grid
-        if len(month_days) < 42:
-            # If less than 42 days, add more days from next month
-            while len(month_days) < 42:
-                last_date = month_days[-1]
-                next_date = last_date + timedelta(days=1)
-                month_days.append(next_date)
-        elif len(month_days) > 42:
-            # If more than 42 days, trim to exactly 42
-            month_days = month_days[:42]
+        # Get the fixed 6x7 grid of dates for this month (memoized per year/month)
+        month_days = month_grid(self.current_date.year, self.current_date.month)
+        self._cell_dates = month_days
         
-        # Create day buttons in 6x7 grid (exactly 42 buttons)
-        for week_idx in range(6):  # Always 6 rows
-            for day_idx in range(7):  # Always 7 columns
-                button_idx = week_idx * 7 + day_idx
-                day_date = month_days[button_idx]
-                
-                # Create day button
-                if day_date.month == self.current_date.month:
-                    # Day belongs to current month
-                    day_text = str(day_date.day)
-                    state = "normal"
-                    command = lambda d=day_date: self.on_day_clicked(d)
-                else:
-                    # Day belongs to adjacent month (show as disabled without number)
-                    day_text = ""
-                    state = "disabled"
-                    command = None
-                
-                day_button = tk.Button(
-                    self.days_frame,
-                    text=day_text,
-                    font=("Arial", 9),
-                    command=command,
-                    relief=tk.RIDGE,
-                    bd=1,
-                    state=state
-                )
-                
-                # Apply styling
-                if day_date.month == self.current_date.month:
-                    # Current month day - apply normal styling
-                    self._apply_day_styling(day_button, day_date)
-                    self.day_buttons[day_date] = day_button
-                else:
-                    # Adjacent month day - gray background, no interaction
-                    day_button.config(bg="#f8f9fa", fg="#dee2e6")
-                
-                # Position button
-                day_button.grid(row=week_idx, column=day_idx, sticky="nsew", padx=0, pady=0)
+        # Reconfigure the 42 existing day cells in place
+        for day_button, day_date in zip(self._cell_buttons, month_days):
+            # Reset any per-day styling left over from the previous month
+            day_button.config(font=ui_font(self, 9), **self._cell_defaults)
+            
+            if day_date.month == self.current_date.month:
+                # Day belongs to current month - apply normal styling
+                day_button.config(text=str(day_date.day), state="normal")
+                self._apply_day_styling(day_button, day_date)
+                self.day_buttons[day_date] = day_button
+            else:
+                # Day belongs to adjacent month (show as disabled without number)
+                day_button.config(text="", state="disabled", bg="#f8f9fa", fg="#dee2e6")
     
     def _apply_day_styling(self, button: tk.Button, button_date: date):
         """Apply styling to a day button based on classification and special dates."""
@@ -226,10 +223,10 @@ class CalendarMonthModule(tk.Frame):
             # Target completion date - use specific color based on target type, override classification color
             target_color = target_info.get('color', 'goldenrod')
             button.config(bg=target_color, fg="black", highlightbackground=target_color,
-                         highlightcolor=target_color, highlightthickness=3, font=("Arial", 9, "bold"))
+                         highlightcolor=target_color, highlightthickness=3, font=ui_font(self, 9, "bold"))
         elif button_date == date.today():
             # Today - red bold text with background (could be visa color or classification color)
-            button.config(bg=default_color, fg="red", font=("Arial", 9, "bold"))
+            button.config(bg=default_color, fg="red", font=ui_font(self, 9, "bold"))
         else:
             # Normal day - use background color (could be visa color or classification color)
             button.config(bg=default_color, fg=text_color)
@@ -240,6 +237,10 @@ class CalendarMonthModule(tk.Frame):
             if button_date > timeline_info.get('end_date', date.today()):
                 button.config(state=tk.DISABLED, bg="#f8f9fa", fg="gray")
     
+    def _on_cell_clicked(self, cell_index: int):
+        """Dispatch a click on a grid cell to the date it currently shows."""
+        self.on_day_clicked(self._cell_dates[cell_index])
+    
     def on_day_clicked(self, clicked_date: date):
         """Handle day button click."""
         old_date = self.current_date
@@ -255,8 +256,17 @@ class CalendarMonthModule(tk.Frame):
             self.date_selected_callback(clicked_date)
     
     def refresh_display(self):
-        """Refresh the month calendar display."""
-        self.update_month_display()
+        """Mark the month calendar dirty and schedule a redraw when idle."""
+        self._dirty = True
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._redraw_if_dirty)
+    
+    def _redraw_if_dirty(self):
+        """Idle callback - redraw only if nothing has redrawn since invalidation."""
+        self._redraw_pending = False
+        if self._dirty:
+            self.update_month_display()
     
     def refresh_colors_only(self):
         """Refresh only the colors of existing buttons (more efficient than full rebuild)."""
@@ -272,9 +282,9 @@ class CalendarMonthModule(tk.Frame):
                 # Update target date styling if applicable
                 if button_date in self.target_dates:
                     target_info = self.target_dates[button_date]
-                    button.config(fg=target_info.get('color', 'goldenrod'), font=("Arial", 8, "bold"))
+                    button.config(fg=target_info.get('color', 'goldenrod'), font=ui_font(self, 8, "bold"))
                 else:
-                    button.config(fg="black", font=("Arial", 8))
+                    button.config(fg="black", font=ui_font(self, 8))
                     
             except (ValueError, KeyError):
                 continue
@@ -7,11 +7,13 @@ Similar to calendar_month_module.py but shows all 12 months of a year.
 
 import tkinter as tk
 import calendar
-from datetime import date, timedelta, timedelta
+from datetime import date
 from typing import Optional, Callable
 
 from calendar_app.config import AppConfig
 from calendar_app.model.timeline import DateTimeline
+from calendar_app.ui.fonts import ui_font
+from calendar_app.ui.month_grid import month_grid
 
 
 class CalendarYearModule(tk.Frame):
@@ -120,7 +122,7 @@ class CalendarYearModule(tk.Frame):
             month_label = tk.Label(
                 month_frame,
                 text=month_name,
-                font=("Arial", 10, "bold"),
+                font=ui_font(self, 10, "bold"),
                 bg="#e9ecef",
                 fg="black",
                 relief=tk.RIDGE,
@@ -191,20 +193,8 @@ class CalendarYearModule(tk.Frame):
         # Update frame reference
         month_frame.days_frame = days_frame
         
-        # Get calendar data for this month
-        cal = calendar.Calendar(0)  # Monday as first day
-        month_days = list(cal.itermonthdates(year, month_num))
-        
-        # Ensure exactly 42 days (6 weeks x 7 days) for consistent 7x6 grid
-        if len(month_days) < 42:
-            # If less than 42 days, add more days from next month
-            while len(month_days) < 42:
-                last_date = month_days[-1]
-                next_date = last_date + timedelta(days=1)
-                month_days.append(next_date)
-        elif len(month_days) > 42:
-            # If more than 42 days, trim to exactly 42
-            month_days = month_days[:42]
+        # Get the fixed 6x7 grid of dates for this month (memoized per year/month)
+        month_days = month_grid(year, month_num)
         
         # Create day buttons in 6x7 grid (exactly 42 buttons)
         for week_idx in range(6):  # Always 6 rows
@@ -231,7 +221,7 @@ class CalendarYearModule(tk.Frame):
                 day_button = tk.Button(
                     days_frame,
                     text=day_text,
-                    font=("Arial", 7),
+                    font=ui_font(self, 7),
                     bg=bg_color,
                     fg=text_color,
                     relief=tk.RIDGE,
@@ -271,13 +261,13 @@ class CalendarYearModule(tk.Frame):
             # Target completion date - use specific color based on target type, override classification color
             target_color = target_info.get('color', 'goldenrod')
             button.config(bg=target_color, fg="black", highlightbackground=target_color,
-                         highlightcolor=target_color, highlightthickness=2, font=("Arial", 7, "bold"))
+                         highlightcolor=target_color, highlightthickness=2, font=ui_font(self, 7, "bold"))
         elif button_date == date.today():
             # Today - red bold text with background (could be visa color or classification color)
-            button.config(bg=bg_color, fg="red", font=("Arial", 7, "bold"))
+            button.config(bg=bg_color, fg="red", font=ui_font(self, 7, "bold"))
         else:
             # Normal day - use background color (could be visa color or classification color)
-            button.config(bg=bg_color, fg=text_color, font=("Arial", 7))
+            button.config(bg=bg_color, fg=text_color, font=ui_font(self, 7))
     
     def create_all_month_frames(self):
         """Create all 12 month frames at once for better performance."""
@@ -304,7 +294,7 @@ class CalendarYearModule(tk.Frame):
             month_label = tk.Label(
                 month_frame,
                 text=month_name,
-                font=("Arial", 10, "bold"),
+                font=ui_font(self, 10, "bold"),
                 bg="#e9ecef",
                 fg="black",
                 relief=tk.RIDGE,
@@ -358,20 +348,8 @@ class CalendarYearModule(tk.Frame):
         # Update frame reference
         month_frame.days_frame = days_frame
         
-        # Get calendar data for this month
-        cal = calendar.Calendar(0)  # Monday as first day
-        month_days = list(cal.itermonthdates(year, month_num))
-        
-        # Ensure exactly 42 days (6 weeks x 7 days) for consistent 7x6 grid
-        if len(month_days) < 42:
-            # If less than 42 days, add more days from next month
-            while len(month_days) < 42:
-                last_date = month_days[-1]
-                next_date = last_date + timedelta(days=1)
-                month_days.append(next_date)
-        elif len(month_days) > 42:
-            # If more than 42 days, trim to exactly 42
-            month_days = month_days[:42]
+        # Get the fixed 6x7 grid of dates for this month (memoized per year/month)
+        month_days = month_grid(year, month_num)
         # Create day buttons in 6x7 grid (exactly 42 buttons)
         for week_idx in range(6):  # Always 6 rows
             for day_idx in range(7):  # Always 7 columns
@@ -397,7 +375,7 @@ class CalendarYearModule(tk.Frame):
                 day_button = tk.Button(
                     days_frame,
                     text=day_text,
-                    font=("Arial", 7),
+                    font=ui_font(self, 7),
                     bg=bg_color,
                     fg=text_color,
                     relief=tk.RIDGE,
@@ -0,0 +1,33 @@
+"""
+Month Grid Layout
+
+Date layout of a month calendar page, shared by the month and year views.
+"""
+
+import calendar
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=64)
+def month_grid(year: int, month: int) -> Tuple[date, ...]:
+    """
+    Get the 42 dates (6 weeks x 7 days, Monday first) shown for a month.
+    
+    Pure function of (year, month), so the layout is memoized and navigating
+    back and forth between months reuses it instead of recomputing it.
+    
+    Args:
+        year: Year of the month to lay out
+        month: Month number (1-12)
+        
+    Returns:
+        Tuple of exactly 42 dates, padded with days from adjacent months
+    """
+    month_days = list(calendar.Calendar(0).itermonthdates(year, month))
+    
+    # Ensure exactly 42 days (6 weeks x 7 days) for consistent 7x6 grid
+    while len(month_days) < 42:
+        month_days.append(month_days[-1] + timedelta(days=1))
+    return tuple(month_days[:42])
@@ -8,9 +8,10 @@ from pathlib import Path
 from datetime import date, timedelta
 
 # Add the src directory to Python path to import our modules
-project_root = Path(__file__).parent.parent
+project_root = Path(__file__).parent.parent.parent
 src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
 
 from calendar_app.model.day import Day, DayClassification
 
@@ -29,10 +30,8 @@ def test_day_classification_enum():
         'UNKNOWN': "unknown"
     }
     
-    for name, value in expected_values.items():
-        enum_item = getattr(DayClassification, name)
-        assert enum_item.value == value, f"Expected {name} to have value {value}, got {enum_item.value}"
-        print(f"✓ {name} = {enum_item.value}")
+    actual_values = {classification.name: classification.value for classification in DayClassification}
+    assert actual_values == expected_values, f"Expected enum values {expected_values}, got {actual_values}"
     
     print("✓ All DayClassification enum values correct\n")
 
@@ -47,7 +46,7 @@ def test_day_basic_functionality():
     
     # Test initialization
     assert day.date == test_date, f"Expected date {test_date}, got {day.date}"
-    assert day.classification == DayClassification.UNKNOWN, f"Expected UNKNOWN classification, got {day.classification}"
+    assert day.classification is DayClassification.UNKNOWN, f"Expected UNKNOWN classification, got {day.classification}"
     assert day.trip_info is None, f"Expected None trip_info, got {day.trip_info}"
     assert day.visaPeriod_info is None, f"Expected None visaPeriod_info, got {day.visaPeriod_info}"
     print("✓ Day initialization correct")
@@ -11,18 +11,21 @@ from typing import Dict, List
 # Add the src directory to Python path to import our modules
 project_root = Path(__file__).parent.parent.parent
 src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
 
 from calendar_app.model.day import Day, DayClassification
 from calendar_app.model.timeline import DateTimeline
 from calendar_app.model.trips import TripClassifier
 from calendar_app.model.visaPeriods import VisaClassifier
+from calendar_app.model import ilr_statistics as ilr_statistics_module
 from calendar_app.model.ilr_statistics import ILRStatisticsEngine, ILRProgress, ILRStatistics
 from calendar_app.config import AppConfig
 
 
 class MockAppConfig:
     """Mock AppConfig for testing."""
+    __slots__ = ("start_year", "end_year", "first_entry_date", "objective_years", "first_entry_date_obj")
     def __init__(self, start_year: int, end_year: int, first_entry_date: str, objective_years: int = 5):
         self.start_year = start_year
         self.end_year = end_year
@@ -105,18 +108,14 @@ class MockVisaClassifier:
     
     def add_mock_visaPeriod(self, start_date, end_date, visaPeriod_id="mock_visa", salary="£30000.00"):
         """Add a mock visa period for testing"""
-        from datetime import timedelta
-        current_date = start_date
-        
-        while current_date <= end_date:
-            self._mock_visaPeriod_periods[current_date] = {
+        for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+            self._mock_visaPeriod_periods[date.fromordinal(ordinal)] = {
                 'visaPeriod_id': visaPeriod_id,
                 'visaPeriod_label': f'Mock Visa {visaPeriod_id}',
                 'start_date': start_date,
                 'end_date': end_date,
                 'gross_salary': salary
             }
-            current_date += timedelta(days=1)
 
 
 def create_test_timeline_with_classifications(config):
@@ -128,28 +127,20 @@ def create_test_timeline_with_classifications(config):
     # Set up test classifications
     first_entry = config.first_entry_date_obj
     
-    # Add some short trips
-    short_trip_dates = [
-        first_entry + timedelta(days=30),  # 30 days after entry
-        first_entry + timedelta(days=31),  # 2-day short trip
-        first_entry + timedelta(days=100),  # 100 days after entry
-        first_entry + timedelta(days=101)   # 2-day short trip
-    ]
-    
-    for trip_date in short_trip_dates:
-        timeline.update_day_classification(trip_date, DayClassification.SHORT_TRIP)
-    
-    # Add some long trips
-    long_trip_dates = [
-        first_entry + timedelta(days=200),  # 200 days after entry
-        first_entry + timedelta(days=201),  # 5-day long trip
-        first_entry + timedelta(days=202),
-        first_entry + timedelta(days=203),
-        first_entry + timedelta(days=204)
-    ]
-    
-    for trip_date in long_trip_dates:
-        timeline.update_day_classification(trip_date, DayClassification.LONG_TRIP)
+    # Add some short trips (2 days each, 30 and 100 days after entry)
+    for trip_offset in (30, 100):
+        timeline.update_date_range_classification(
+            first_entry + timedelta(days=trip_offset),
+            first_entry + timedelta(days=trip_offset + 1),
+            DayClassification.SHORT_TRIP
+        )
+    
+    # Add a long trip (5 days, 200 days after entry)
+    timeline.update_date_range_classification(
+        first_entry + timedelta(days=200),
+        first_entry + timedelta(days=204),
+        DayClassification.LONG_TRIP
+    )
     
     return timeline
 
@@ -553,6 +544,72 @@ def test_no_visa_coverage_counting():
     
     print("✓ All NO_VISA_COVERAGE counting tests passed\n")
 
+def test_global_statistics_cache():
+    """Test that memoized global statistics are recomputed when their inputs change."""
+    print("=== Testing Global Statistics Cache ===")
+    
+    config = MockAppConfig(2023, 2024, "01-03-2023", objective_years=2)
+    timeline = create_test_timeline_with_classifications(config)
+    ilr_engine = ILRStatisticsEngine(timeline, config)
+    calc_date = date(2023, 9, 1)
+    
+    stats = ilr_engine.get_global_statistics(calculation_date=calc_date)
+    assert ilr_engine.get_global_statistics(calculation_date=calc_date) is stats, "Unchanged inputs should return the memoized statistics"
+    print("✓ Repeated query returns memoized statistics")
+    
+    # Single-day update: one in-UK day becomes a long trip day
+    changed_date = date(2023, 5, 1)
+    assert timeline.get_day(changed_date).classification is not DayClassification.LONG_TRIP
+    timeline.update_day_classification(changed_date, DayClassification.LONG_TRIP)
+    after_day = ilr_engine.get_global_statistics(calculation_date=calc_date)
+    assert after_day is not stats, "update_day_classification should invalidate the memo"
+    assert after_day.long_trip_days == stats.long_trip_days + 1, f"Expected {stats.long_trip_days + 1} long trip days, got {after_day.long_trip_days}"
+    assert after_day.ilr_total_days == stats.ilr_total_days - 1, f"Expected {stats.ilr_total_days - 1} ILR days, got {after_day.ilr_total_days}"
+    print("✓ update_day_classification invalidates memoized statistics")
+    
+    # Range update: three more days become short trip days (still ILR total days)
+    timeline.update_date_range_classification(date(2023, 6, 1), date(2023, 6, 3), DayClassification.SHORT_TRIP)
+    after_range = ilr_engine.get_global_statistics(calculation_date=calc_date)
+    assert after_range is not after_day, "update_date_range_classification should invalidate the memo"
+    assert after_range.short_trip_days == after_day.short_trip_days + 3, f"Expected {after_day.short_trip_days + 3} short trip days, got {after_range.short_trip_days}"
+    assert after_range.ilr_total_days == after_day.ilr_total_days, "Short trip days still count towards the total"
+    print("✓ update_date_range_classification invalidates memoized statistics")
+    
+    # First entry date moved 10 days later: counting starts from the new date
+    config.first_entry_date_obj = date(2023, 3, 11)
+    after_entry = ilr_engine.get_global_statistics(calculation_date=calc_date)
+    assert after_entry is not after_range, "A changed first entry date should invalidate the memo"
+    assert after_entry.first_entry_date == date(2023, 3, 11)
+    assert after_entry.ilr_total_days == after_range.ilr_total_days - 10, f"Expected {after_range.ilr_total_days - 10} ILR days, got {after_entry.ilr_total_days}"
+    assert after_entry.days_since_entry == after_range.days_since_entry - 10
+    print("✓ Changed first entry date invalidates memoized statistics")
+    
+    # Different today: completion date is only projected for dates up to today
+    class FixedToday(date):
+        current = None
+        
+        @classmethod
+        def today(cls):
+            return cls.current
+    
+    original_date = ilr_statistics_module.date
+    ilr_statistics_module.date = FixedToday
+    try:
+        FixedToday.current = calc_date - timedelta(days=1)
+        before_today = ilr_engine.get_global_statistics(calculation_date=calc_date)
+        assert before_today.total_scenario.target_completion_date is None, "No projection for a date after today"
+        
+        FixedToday.current = calc_date
+        on_today = ilr_engine.get_global_statistics(calculation_date=calc_date)
+        assert on_today is not before_today, "A new today should invalidate the memo"
+        assert on_today.total_scenario.target_completion_date is not None, "Projection expected once the date is not after today"
+    finally:
+        ilr_statistics_module.date = original_date
+    print("✓ Changed today invalidates memoized statistics")
+    
+    print("✓ All global statistics cache tests passed\n")
+
+
 def test_remaining_days_breakdown():
     """Test the remaining days breakdown functionality."""
     print("=== Testing Remaining Days Breakdown ===")
@@ -629,6 +686,9 @@ def run_all_ilr_statistics_tests():
         test_no_visa_coverage_counting()
         print()
         
+        test_global_statistics_cache()
+        print()
+        
         test_remaining_days_breakdown()
         print()
         
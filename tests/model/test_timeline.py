@@ -5,13 +5,14 @@ Tests all functionality of DateTimeline class.
 
 import sys
 from pathlib import Path
-from datetime import date, timedelta
+from datetime import date
 import calendar
 
 # Add the src directory to Python path to import our modules
-project_root = Path(__file__).parent.parent
+project_root = Path(__file__).parent.parent.parent
 src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
 
 from calendar_app.model.day import Day, DayClassification
 from calendar_app.model.timeline import DateTimeline
@@ -31,13 +32,15 @@ def teardown_test():
 class MockAppConfig:
     """Mock AppConfig for testing without JSON files."""
     
+    __slots__ = ("start_year", "end_year", "first_entry_date", "first_entry_date_obj", "objective_years", "processing_buffer_years")
+    
     def __init__(self, start_year=2023, end_year=2040, first_entry_date="29-03-2023"):
         self.start_year = start_year
         self.end_year = end_year
         self.first_entry_date = first_entry_date
         # Mock the parsed date object
-        from datetime import datetime
-        self.first_entry_date_obj = datetime.strptime(first_entry_date, "%d-%m-%Y").date()
+        day, month, year = first_entry_date.split('-')
+        self.first_entry_date_obj = date(int(year), int(month), int(day))
         # Add other required attributes
         self.objective_years = 10
         self.processing_buffer_years = 1
@@ -83,8 +86,6 @@ class MockTripClassifier:
     
     def add_mock_trip(self, start_date, end_date, is_short_trip=True, trip_id="mock_trip"):
         """Add a mock trip for testing"""
-        from datetime import timedelta
-        current_date = start_date
         trip_info = {
             "id": trip_id,
             "is_short_trip": is_short_trip,
@@ -93,9 +94,8 @@ class MockTripClassifier:
             "trip_length_days": (end_date - start_date).days + 1
         }
         
-        while current_date <= end_date:
-            self._mock_trips[current_date] = trip_info
-            current_date += timedelta(days=1)
+        for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+            self._mock_trips[date.fromordinal(ordinal)] = trip_info
 
 
 class MockVisaPeriodClassifier:
@@ -143,18 +143,14 @@ class MockVisaPeriodClassifier:
     
     def add_mock_visaPeriod(self, start_date, end_date, visaPeriod_id="mock_visa", salary="£30000.00"):
         """Add a mock visa period for testing"""
-        from datetime import timedelta
-        current_date = start_date
-        
-        while current_date <= end_date:
-            self._mock_visaPeriod_periods[current_date] = {
+        for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+            self._mock_visaPeriod_periods[date.fromordinal(ordinal)] = {
                 'visaPeriod_id': visaPeriod_id,
                 'visaPeriod_label': f'Mock Visa {visaPeriod_id}',
                 'start_date': start_date,
                 'end_date': end_date,
                 'gross_salary': salary
             }
-            current_date += timedelta(days=1)
 
 
 def test_date_timeline_creation():
@@ -192,6 +188,17 @@ def test_date_timeline_creation():
         assert "Timeline instance exists with range" in str(e), f"Expected specific error message, got: {e}"
         print("✓ Singleton correctly rejects different config")
     
+    # Test singleton with same year range but a different first entry date
+    moved_entry_config = MockAppConfig(2023, 2025, "01-06-2023")  # Different first entry only
+    try:
+        DateTimeline.from_config(moved_entry_config, MockTripClassifier(moved_entry_config),
+                                 MockVisaPeriodClassifier(moved_entry_config))
+        assert False, "Should raise ValueError with different first entry date"
+    except ValueError as e:
+        assert "(first entry 01-01-2023)" in str(e), f"Expected existing first entry in message, got: {e}"
+        assert "(first entry 01-06-2023)" in str(e), f"Expected requested first entry in message, got: {e}"
+        print("✓ Singleton correctly rejects different first entry date")
+    
     # Test non-singleton creation
     timeline3 = DateTimeline.from_config(different_config, different_mock_classifier, different_mock_visaPeriod_classifier, use_singleton=False)
     assert timeline3 is not timeline1, "Non-singleton should create new instance"
@@ -317,8 +324,8 @@ def test_date_timeline_classification_methods():
     pre_entry_day = timeline.get_day(date(2023, 2, 15))  # Before first entry
     uk_residence_day = timeline.get_day(date(2023, 4, 15))  # After first entry
     
-    assert pre_entry_day.classification == DayClassification.PRE_ENTRY, f"Expected PRE_ENTRY, got {pre_entry_day.classification}"
-    assert uk_residence_day.classification == DayClassification.UK_RESIDENCE, f"Expected UK_RESIDENCE, got {uk_residence_day.classification}"
+    assert pre_entry_day.classification is DayClassification.PRE_ENTRY, f"Expected PRE_ENTRY, got {pre_entry_day.classification}"
+    assert uk_residence_day.classification is DayClassification.UK_RESIDENCE, f"Expected UK_RESIDENCE, got {uk_residence_day.classification}"
     print("✓ Initial classification correct")
     
     # Test update_day_classification
@@ -331,7 +338,7 @@ def test_date_timeline_classification_methods():
     assert success == True, "update_day_classification should return True for valid date"
     
     updated_day = timeline.get_day(date(2023, 4, 15))
-    assert updated_day.classification == DayClassification.SHORT_TRIP, f"Expected SHORT_TRIP after update, got {updated_day.classification}"
+    assert updated_day.classification is DayClassification.SHORT_TRIP, f"Expected SHORT_TRIP after update, got {updated_day.classification}"
     assert updated_day.trip_info["trip_id"] == "test_trip", f"Expected trip_info to be set, got {updated_day.trip_info}"
     assert updated_day.visaPeriod == "Student Visa", f"Expected visaPeriod to be set, got {updated_day.visaPeriod}"
     print("✓ update_day_classification() works correctly")
@@ -380,17 +387,17 @@ def test_no_visa_coverage_classification():
     
     # Test days within visa coverage - should be UK_RESIDENCE
     covered_day = timeline.get_day(date(2023, 6, 15))  # Within Student Visa period
-    assert covered_day.classification == DayClassification.UK_RESIDENCE, f"Expected UK_RESIDENCE for covered day, got {covered_day.classification}"
+    assert covered_day.classification is DayClassification.UK_RESIDENCE, f"Expected UK_RESIDENCE for covered day, got {covered_day.classification}"
     print("✓ Days with visa coverage classified as UK_RESIDENCE")
     
     # Test days without visa coverage - should be NO_VISA_COVERAGE
     gap_day = timeline.get_day(date(2023, 7, 15))  # In gap between Student and Work visas
-    assert gap_day.classification == DayClassification.NO_VISA_COVERAGE, f"Expected NO_VISA_COVERAGE for gap day, got {gap_day.classification}"
+    assert gap_day.classification is DayClassification.NO_VISA_COVERAGE, f"Expected NO_VISA_COVERAGE for gap day, got {gap_day.classification}"
     print("✓ Days without visa coverage classified as NO_VISA_COVERAGE")
     
     # Test days in another visa period - should be UK_RESIDENCE
     second_visa_day = timeline.get_day(date(2023, 8, 15))  # Within Work Visa period
-    assert second_visa_day.classification == DayClassification.UK_RESIDENCE, f"Expected UK_RESIDENCE for second visa day, got {second_visa_day.classification}"
+    assert second_visa_day.classification is DayClassification.UK_RESIDENCE, f"Expected UK_RESIDENCE for second visa day, got {second_visa_day.classification}"
     print("✓ Days in second visa period classified as UK_RESIDENCE")
     
     # Test classification counts include NO_VISA_COVERAGE
@@ -435,7 +442,7 @@ def test_date_timeline_auto_classification():
     
     # Verify that days before first entry are properly classified
     test_pre_entry = timeline.get_day(date(2023, 5, 15))
-    assert test_pre_entry.classification == DayClassification.PRE_ENTRY, f"Expected PRE_ENTRY, got {test_pre_entry.classification}"
+    assert test_pre_entry.classification is DayClassification.PRE_ENTRY, f"Expected PRE_ENTRY, got {test_pre_entry.classification}"
     print("✓ classify_pre_entry_days() works correctly")
     
     # Test auto_classify_all_days by creating a timeline with some UNKNOWN days
@@ -450,7 +457,7 @@ def test_date_timeline_auto_classification():
     
     # Verify the day was reclassified
     reclassified_day = timeline.get_day(date(2023, 7, 15))
-    assert reclassified_day.classification == DayClassification.UK_RESIDENCE, f"Expected UK_RESIDENCE after auto-classification, got {reclassified_day.classification}"
+    assert reclassified_day.classification is DayClassification.UK_RESIDENCE, f"Expected UK_RESIDENCE after auto-classification, got {reclassified_day.classification}"
     print("✓ auto_classify_all_days() works correctly")
     
     # Test validate_no_unknown_days
@@ -600,7 +607,7 @@ def test_error_conditions():
     # Verify the updates
     for i in range(1, 4):
         day = timeline.get_day(date(2023, 1, i))
-        assert day.classification == DayClassification.SHORT_TRIP, f"Day {i} should be SHORT_TRIP"
+        assert day.classification is DayClassification.SHORT_TRIP, f"Day {i} should be SHORT_TRIP"
     print("✓ update_date_range_classification works correctly")
     
     print("✓ All error condition tests passed\n")
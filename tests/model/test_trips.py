@@ -5,13 +5,14 @@ Tests all functionality of TripClassifier class with real and mock JSON data.
 
 import sys
 from pathlib import Path
-from datetime import date, timedelta
+from datetime import date
 from typing import Dict, List
 
 # Add the src directory to Python path to import our modules
-project_root = Path(__file__).parent.parent
+project_root = Path(__file__).parent.parent.parent
 src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
 
 from calendar_app.model.trips import TripClassifier
 from calendar_app.config import AppConfig
@@ -19,6 +20,7 @@ from calendar_app.config import AppConfig
 
 class MockAppConfig:
     """Mock AppConfig for testing."""
+    __slots__ = ("start_year", "end_year", "first_entry_date", "first_entry_date_obj")
     def __init__(self, start_year: int, end_year: int, first_entry_date: str):
         self.start_year = start_year
         self.end_year = end_year
@@ -89,13 +91,12 @@ def test_trip_classifier_initialization():
     short_trip_start = date(2023, 6, 10)
     short_trip_end = date(2023, 6, 20)
     
-    current_date = short_trip_start
-    while current_date <= short_trip_end:
+    for ordinal in range(short_trip_start.toordinal(), short_trip_end.toordinal() + 1):
+        current_date = date.fromordinal(ordinal)
         assert current_date in classifier._trip_day_map
         trip_info = classifier._trip_day_map[current_date]
         assert trip_info["id"] == "short_trip_1"
         assert trip_info["is_short_trip"] == True
-        current_date += timedelta(days=1)
     
     print("✓ Trip day map correctly built for short trip")
     
@@ -9,9 +9,10 @@ from datetime import date, timedelta
 from typing import Dict, List
 
 # Add the src directory to Python path to import our modules
-project_root = Path(__file__).parent.parent
+project_root = Path(__file__).parent.parent.parent
 src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
 
 from calendar_app.model.visaPeriods import VisaClassifier
 from calendar_app.config import AppConfig
@@ -19,6 +20,7 @@ from calendar_app.config import AppConfig
 
 class MockAppConfig:
     """Mock AppConfig for testing."""
+    __slots__ = ("start_year", "end_year", "first_entry_date", "first_entry_date_obj")
     def __init__(self, start_year: int, end_year: int, first_entry_date: str):
         self.start_year = start_year
         self.end_year = end_year
@@ -6,15 +6,24 @@ Runs all tests in the proper order with clear reporting.
 
 import sys
 import os
+import io
+from contextlib import redirect_stdout
 from pathlib import Path
 
 # Add the src directory to Python path
 project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
 
-def run_all_tests():
-    """Run all test suites in the proper order."""
+def run_all_tests(quiet: bool = False):
+    """
+    Run all test suites in the proper order.
+    
+    Args:
+        quiet: If True, buffer each suite's per-check output and only show it
+            when that suite fails (summary lines are always printed)
+    """
     print("🔬 Starting Calendar App Comprehensive Test Suite")
     print("=" * 60)
     
@@ -27,6 +36,10 @@ def run_all_tests():
         from model.test_visaPeriods import run_all_visaPeriod_tests
         from model.test_ilr_statistics import run_all_ilr_statistics_tests
         
+        # Configuration and storage tests
+        from test_config import run_all_config_tests
+        from storage.test_json_loader import run_all_json_loader_tests
+        
         # Integration tests
         from test_ilr_requirement import test_ilr_requirement_calculation, test_leap_year_scenarios
         
@@ -38,6 +51,8 @@ def run_all_tests():
     
     # Test execution order (dependencies matter)
     test_suites = [
+        ("Configuration Tests", run_all_config_tests),
+        ("Data Loader Tests", run_all_json_loader_tests),
         ("Day Model Tests", run_all_day_tests),
         ("Trip Classifier Tests", run_all_trips_tests),
         ("Visa Classifier Tests", run_all_visaPeriod_tests),
@@ -54,12 +69,19 @@ def run_all_tests():
         print(f"\n🧪 Running {suite_name}")
         print("-" * 50)
         
+        # In quiet mode the suite's prints go to a buffer instead of the terminal
+        suite_output = io.StringIO()
         try:
-            test_function()
+            if quiet:
+                with redirect_stdout(suite_output):
+                    test_function()
+            else:
+                test_function()
             print(f"✅ {suite_name} PASSED")
             passed_tests += 1
             
         except Exception as e:
+            print(suite_output.getvalue(), end="")
             print(f"❌ {suite_name} FAILED: {e}")
             import traceback
             traceback.print_exc()
@@ -86,5 +108,6 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    success = run_all_tests()
+    # -q / --quiet: only show per-check output for failing suites
+    success = run_all_tests(quiet=any(arg in ("-q", "--quiet") for arg in sys.argv[1:]))
     sys.exit(0 if success else 1)
\ No newline at end of file
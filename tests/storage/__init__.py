@@ -0,0 +1 @@
+# Storage test package
\ No newline at end of file
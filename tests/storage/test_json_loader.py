@@ -0,0 +1,87 @@
+"""
+Test Suite for json_loader.py
+Tests the DataLoader parsed JSON file cache.
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add the src directory to Python path to import our modules
+project_root = Path(__file__).parent.parent.parent
+src_path = project_root / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from calendar_app.storage.json_loader import DataLoader, _JSON_CACHE
+
+
+def write_json(path: Path, data) -> None:
+    """Write data as JSON to path."""
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_json_file_cache():
+    """Test that parsed data files are reused only while mtime and size are unchanged."""
+    print("=== Testing DataLoader JSON Cache ===")
+    
+    DataLoader.clear_cache()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "data").mkdir()
+        file_path = root / "data" / "trips.json"
+        write_json(file_path, [{"id": "a"}])
+        st = file_path.stat()
+        
+        # config is only used by the validate_* methods, not by load_json_file()
+        loader = DataLoader(root, config=None)
+        first = loader.load_json_file("trips.json")
+        assert first == [{"id": "a"}], f"Unexpected parsed data: {first}"
+        assert file_path in _JSON_CACHE, "Parsed file should be cached by path"
+        assert loader.load_json_file("trips.json") is first, "Unchanged file should return the cached list"
+        print("✓ Unchanged file returns cached parse")
+        
+        # Same size and restored mtime: the (stale) cached list must be reused
+        write_json(file_path, [{"id": "b"}])
+        os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert loader.load_json_file("trips.json") is first, "Same mtime and size should hit the cache"
+        print("✓ Cache is keyed on mtime and size")
+        
+        # Same size, new mtime: file is re-parsed
+        os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        reloaded = loader.load_json_file("trips.json")
+        assert reloaded == [{"id": "b"}], f"Expected re-parsed data, got {reloaded}"
+        print("✓ Changed mtime invalidates cache")
+        
+        # Different size (mtime restored): file is re-parsed
+        st = file_path.stat()
+        write_json(file_path, [{"id": "longer"}])
+        os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        reloaded = loader.load_json_file("trips.json")
+        assert reloaded == [{"id": "longer"}], f"Expected re-parsed data, got {reloaded}"
+        print("✓ Changed size invalidates cache")
+        
+        # clear_cache() forces a re-read
+        DataLoader.clear_cache()
+        assert not _JSON_CACHE, "clear_cache() should empty the cache"
+        assert loader.load_json_file("trips.json") is not reloaded, "clear_cache() should force a re-parse"
+        print("✓ clear_cache() forces re-read")
+    
+    DataLoader.clear_cache()
+    print("✓ All DataLoader JSON cache tests passed\n")
+
+
+def run_all_json_loader_tests():
+    """Run all DataLoader tests."""
+    print("=== Running All DataLoader Tests ===\n")
+    
+    test_json_file_cache()
+    
+    print("=== All DataLoader Tests Completed Successfully ===\n")
+
+
+if __name__ == "__main__":
+    run_all_json_loader_tests()
@@ -0,0 +1,146 @@
+"""
+Test Suite for config.py
+Tests AppConfig derived target dates, the add_years helper and the parsed config cache.
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+from datetime import date
+
+# Add the src directory to Python path to import our modules
+project_root = Path(__file__).parent.parent
+src_path = project_root / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from calendar_app.config import AppConfig, add_years, _CONFIG_CACHE
+
+
+def write_config(root: Path, **overrides) -> Path:
+    """Write data/config.json under root (defaults match the template) and return its path."""
+    config_data = {
+        "travel_pdf_folder": "../travel_pdfs",
+        "objective_years": 10,
+        "processing_buffer_years": 1,
+        "start_year": 2023,
+        "end_year": 2040,
+        "first_entry_date": "29-03-2023",
+    }
+    config_data.update(overrides)
+    config_path = root / "data" / "config.json"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text(json.dumps(config_data), encoding="utf-8")
+    return config_path
+
+
+def test_add_years():
+    """Test calendar-year addition including the 29 February rounding rule."""
+    print("=== Testing add_years ===")
+    
+    assert add_years(date(2023, 6, 15), 10) == date(2033, 6, 15), "Normal date should keep day and month"
+    assert add_years(date(2024, 2, 29), 4) == date(2028, 2, 29), "Feb 29 should stay Feb 29 in a leap year"
+    assert add_years(date(2024, 2, 29), 5) == date(2029, 2, 28), "Feb 29 should round down to Feb 28 in a non-leap year"
+    print("✓ add_years handles normal and 29 February dates")
+    
+    print("✓ All add_years tests passed\n")
+
+
+def test_target_completion_dates():
+    """Test target/planning completion dates and ILR target days against hand-computed values."""
+    print("=== Testing Target Completion Dates ===")
+    
+    AppConfig.clear_cache()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        
+        # Normal date: 15-06-2023 + 10 years, leap days 2024, 2028 and 2032 inside the period
+        write_config(root, first_entry_date="15-06-2023", objective_years=10, processing_buffer_years=1)
+        config = AppConfig(root)
+        assert config.target_completion_date == date(2033, 6, 15), f"Expected 2033-06-15, got {config.target_completion_date}"
+        assert config.ilr_target_days == 10 * 365 + 3, f"Expected 3653 days, got {config.ilr_target_days}"
+        assert config.planning_completion_date == date(2034, 6, 15), f"Expected 2034-06-15, got {config.planning_completion_date}"
+        assert config.target_completion_str == "15-06-2033", f"Expected 15-06-2033, got {config.target_completion_str}"
+        print("✓ Normal first entry date targets correct")
+        
+        # 29 February: 2024-02-29 -> 2028-02-29 is 4 * 365 + 1 days, then 365 days to 2029-02-28
+        write_config(root, first_entry_date="29-02-2024", objective_years=5, processing_buffer_years=1)
+        AppConfig.clear_cache()
+        config = AppConfig(root)
+        assert config.target_completion_date == date(2029, 2, 28), f"Expected 2029-02-28, got {config.target_completion_date}"
+        assert config.ilr_target_days == (4 * 365 + 1) + 365, f"Expected 1826 days, got {config.ilr_target_days}"
+        assert config.planning_completion_date == date(2030, 2, 28), f"Expected 2030-02-28, got {config.planning_completion_date}"
+        print("✓ 29 February first entry date rounds down to 28 February")
+    
+    AppConfig.clear_cache()
+    print("✓ All target completion date tests passed\n")
+
+
+def test_config_cache():
+    """Test that parsed configs are reused only while config.json mtime and size are unchanged."""
+    print("=== Testing Config Cache ===")
+    
+    AppConfig.clear_cache()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        config_path = write_config(root, first_entry_date="15-06-2023")
+        st = config_path.stat()
+        
+        config = AppConfig(root)
+        assert config_path in _CONFIG_CACHE, "Parsed config should be cached by path"
+        print("✓ First load stores parsed values in cache")
+        
+        # Same size and restored mtime: the (stale) cached values must be reused
+        write_config(root, first_entry_date="16-06-2023")
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        config = AppConfig(root)
+        assert config.first_entry_date == "15-06-2023", f"Expected cached 15-06-2023, got {config.first_entry_date}"
+        assert config.target_completion_date == date(2033, 6, 15), "Derived values should come from cache too"
+        print("✓ Unchanged mtime and size reuse cached values")
+        
+        # Same size, new mtime: file is re-parsed
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        config = AppConfig(root)
+        assert config.first_entry_date == "16-06-2023", f"Expected reloaded 16-06-2023, got {config.first_entry_date}"
+        assert config.target_completion_date == date(2033, 6, 16), "Derived values should be recomputed"
+        print("✓ Changed mtime invalidates cache")
+        
+        # Different size (mtime restored): file is re-parsed
+        st = config_path.stat()
+        write_config(root, first_entry_date="16-06-2023", objective_years=100)
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        config = AppConfig(root)
+        assert config.objective_years == 100, f"Expected reloaded objective_years 100, got {config.objective_years}"
+        print("✓ Changed size invalidates cache")
+        
+        # clear_cache() forces a re-read even when the file looks unchanged
+        st = config_path.stat()
+        write_config(root, first_entry_date="17-06-2023", objective_years=100)
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        AppConfig.clear_cache()
+        assert not _CONFIG_CACHE, "clear_cache() should empty the cache"
+        config = AppConfig(root)
+        assert config.first_entry_date == "17-06-2023", f"Expected re-read 17-06-2023, got {config.first_entry_date}"
+        print("✓ clear_cache() forces re-read")
+    
+    AppConfig.clear_cache()
+    print("✓ All config cache tests passed\n")
+
+
+def run_all_config_tests():
+    """Run all AppConfig tests."""
+    print("=== Running All AppConfig Tests ===\n")
+    
+    test_add_years()
+    test_target_completion_dates()
+    test_config_cache()
+    
+    print("=== All AppConfig Tests Completed Successfully ===\n")
+
+
+if __name__ == "__main__":
+    run_all_config_tests()